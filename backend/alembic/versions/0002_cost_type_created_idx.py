@@ -0,0 +1,19 @@
+"""Index cost_profiles by (resource_type, created_at) for cost aggregation."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_cost_type_created_idx"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_cost_resource_type_created", "cost_profiles", ["resource_type", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_cost_resource_type_created", table_name="cost_profiles")
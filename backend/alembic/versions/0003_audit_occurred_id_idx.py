@@ -0,0 +1,20 @@
+"""Index audit_logs by (occurred_at, id) for keyset pagination."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_audit_occurred_id_idx"
+down_revision = "0002_cost_type_created_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Scanned backwards for ORDER BY occurred_at DESC, id DESC
+    op.create_index("idx_audit_occurred_id", "audit_logs", ["occurred_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_occurred_id", table_name="audit_logs")
@@ -0,0 +1,30 @@
+"""Composite indexes matching governance/audit/cost repository filters and ordering."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_governance_filter_idx"
+down_revision = "0003_audit_occurred_id_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filter columns first, then the ORDER BY column (scanned backwards for DESC)
+    op.create_index(
+        "idx_governance_scope_status_created", "governance_policies", ["scope", "status", "created_at"]
+    )
+    op.create_index(
+        "idx_cost_resource_created", "cost_profiles", ["resource_type", "resource_id", "created_at"]
+    )
+    op.create_index("idx_audit_actor_occurred", "audit_logs", ["actor_id", "occurred_at"])
+    op.create_index("idx_audit_resource_type_occurred", "audit_logs", ["resource_type", "occurred_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_resource_type_occurred", table_name="audit_logs")
+    op.drop_index("idx_audit_actor_occurred", table_name="audit_logs")
+    op.drop_index("idx_cost_resource_created", table_name="cost_profiles")
+    op.drop_index("idx_governance_scope_status_created", table_name="governance_policies")
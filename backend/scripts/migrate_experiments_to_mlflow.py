@@ -36,7 +36,7 @@ def migrate_experiments(session: Session) -> None:
     adapter = MLflowAdapter(
         {
             "enabled": True,
-            "tracking_uri": str(settings.mlflow_tracking_uri),
+            "tracking_uri": settings.mlflow_tracking_uri,
         }
     )
 
@@ -1,8 +1,12 @@
 """Governance, observability, and cost API routes."""
 from __future__ import annotations
 
+import base64
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from core.database import get_session
@@ -15,6 +19,30 @@ from governance.services.policies import GovernancePolicyService
 router = APIRouter(prefix="/llm-ops/v1/governance", tags=["governance"])
 
 
+def _encode_audit_cursor(occurred_at: datetime, log_id: UUID) -> str:
+    """Encode an audit log keyset position as an opaque URL-safe string."""
+    return base64.urlsafe_b64encode(f"{occurred_at.isoformat()}|{log_id}".encode()).decode()
+
+
+def _decode_audit_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by _encode_audit_cursor."""
+    try:
+        occurred_at, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(occurred_at), UUID(log_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid audit log cursor") from None
+
+
+def _json_response(envelope: BaseModel) -> Response:
+    """Serialize an already-validated envelope in one pass.
+
+    Returning a Response makes FastAPI skip re-validating every list item
+    against ``response_model``; the model is kept on the route for the
+    OpenAPI schema.
+    """
+    return Response(content=envelope.model_dump_json(), media_type="application/json")
+
+
 def get_governance_service(session: Session = Depends(get_session)) -> GovernancePolicyService:
     """Dependency to get governance policy service."""
     return GovernancePolicyService(session)
@@ -64,24 +92,26 @@ def list_policies(
     scope: str | None = Query(None),
     status: str | None = Query(None),
     service: GovernancePolicyService = Depends(get_governance_service),
-) -> EnvelopeGovernancePolicyList:
+) -> Response:
     """List governance policies with optional filters."""
     policies = service.list_policies(scope=scope, status=status)
-    return EnvelopeGovernancePolicyList(
-        status="success",
-        message="",
-        data=[
-            schemas.GovernancePolicyResponse(
-                id=str(p.id),
-                name=p.name,
-                scope=p.scope,
-                rules=p.rules,
-                status=p.status,
-                lastReviewedAt=p.last_reviewed_at,
-                createdAt=p.created_at,
-            )
-            for p in policies
-        ],
+    return _json_response(
+        EnvelopeGovernancePolicyList(
+            status="success",
+            message="",
+            data=[
+                schemas.GovernancePolicyResponse(
+                    id=str(p.id),
+                    name=p.name,
+                    scope=p.scope,
+                    rules=p.rules,
+                    status=p.status,
+                    lastReviewedAt=p.last_reviewed_at,
+                    createdAt=p.created_at,
+                )
+                for p in policies
+            ],
+        )
     )
 
 
@@ -120,27 +150,39 @@ def list_audit_logs(
     resourceType: str | None = Query(None, alias="resource_type"),
     action: str | None = Query(None),
     limit: int = Query(100, le=1000),
+    cursor: str | None = Query(None, description="nextCursor from the previous page"),
     session: Session = Depends(get_session),
-) -> schemas.EnvelopeAuditLogs:
-    """List audit logs with optional filters."""
+) -> Response:
+    """List audit logs with optional filters, newest first, paginated by cursor."""
     audit_repo = AuditLogRepository(session)
-    logs = audit_repo.list(actor_id=actorId, resource_type=resourceType, action=action, limit=limit)
-    return schemas.EnvelopeAuditLogs(
-        status="success",
-        message="",
-        data=[
-            schemas.AuditLogResponse(
-                id=str(log.id),
-                actorId=log.actor_id,
-                action=log.action,
-                resourceType=log.resource_type,
-                resourceId=log.resource_id,
-                result=log.result,
-                metadata=log.log_metadata,
-                occurredAt=log.occurred_at,
-            )
-            for log in logs
-        ],
+    logs = audit_repo.list(
+        actor_id=actorId,
+        resource_type=resourceType,
+        action=action,
+        limit=limit,
+        cursor=_decode_audit_cursor(cursor) if cursor else None,
+    )
+    # A full page means there may be more rows after the last one
+    next_cursor = _encode_audit_cursor(logs[-1].occurred_at, logs[-1].id) if logs and len(logs) == limit else None
+    return _json_response(
+        schemas.EnvelopeAuditLogs(
+            status="success",
+            message="",
+            data=[
+                schemas.AuditLogResponse(
+                    id=str(log.id),
+                    actorId=log.actor_id,
+                    action=log.action,
+                    resourceType=log.resource_type,
+                    resourceId=log.resource_id,
+                    result=log.result,
+                    metadata=log.log_metadata,
+                    occurredAt=log.occurred_at,
+                )
+                for log in logs
+            ],
+            nextCursor=next_cursor,
+        )
     )
 
 
@@ -150,29 +192,31 @@ def list_cost_profiles(
     resourceId: str | None = Query(None, alias="resource_id"),
     timeWindow: str | None = Query(None, alias="time_window"),
     service: CostService = Depends(get_cost_service),
-) -> EnvelopeCostProfileList:
+) -> Response:
     """List cost profiles with optional filters."""
     profiles = service.list_cost_profiles(
         resource_type=resourceType, resource_id=resourceId, time_window=timeWindow
     )
-    return EnvelopeCostProfileList(
-        status="success",
-        message="",
-        data=[
-            schemas.CostProfileResponse(
-                id=str(p.id),
-                resourceType=p.resource_type,
-                resourceId=str(p.resource_id),
-                timeWindow=p.time_window,
-                gpuHours=p.gpu_hours,
-                tokenCount=p.token_count,
-                costAmount=p.cost_amount,
-                costCurrency=p.cost_currency,
-                budgetVariance=p.budget_variance,
-                createdAt=p.created_at,
-            )
-            for p in profiles
-        ],
+    return _json_response(
+        EnvelopeCostProfileList(
+            status="success",
+            message="",
+            data=[
+                schemas.CostProfileResponse(
+                    id=str(p.id),
+                    resourceType=p.resource_type,
+                    resourceId=str(p.resource_id),
+                    timeWindow=p.time_window,
+                    gpuHours=p.gpu_hours,
+                    tokenCount=p.token_count,
+                    costAmount=p.cost_amount,
+                    costCurrency=p.cost_currency,
+                    budgetVariance=p.budget_variance,
+                    createdAt=p.created_at,
+                )
+                for p in profiles
+            ],
+        )
     )
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 
 from core.settings import get_settings
@@ -28,11 +30,14 @@ def health_check():
     }
 
 
+@lru_cache(maxsize=1)
 def _build_adapters():
     """Construct adapters based on current settings.
 
     This keeps the endpoint self‑contained and avoids adding new
-    dependencies to the main application wiring.
+    dependencies to the main application wiring. Settings are immutable,
+    so the adapters are built once and their cached health results are
+    shared across polls.
     """
     settings = get_settings()
 
@@ -40,9 +45,7 @@ def _build_adapters():
         "experiment_tracking": MLflowAdapter(
             {
                 "enabled": settings.experiment_tracking_enabled and settings.mlflow_enabled,
-                "tracking_uri": str(settings.mlflow_tracking_uri)
-                if settings.mlflow_tracking_uri
-                else "",
+                "tracking_uri": settings.mlflow_tracking_uri or "",
             }
         ),
         "serving": KServeAdapter(
@@ -46,7 +46,7 @@ def _get_endpoint_k8s_name(endpoint_id: str | UUID) -> str:
     # If an override is provided (e.g., direct IP to node/service), use it
     # so that subsequent URL building can skip cluster DNS hostnames.
     if settings.serving_inference_host_override:
-        return str(settings.serving_inference_host_override).rstrip("/")
+        return settings.serving_inference_host_override
     
     endpoint_id_str = str(endpoint_id).replace("-", "")
     short_id = endpoint_id_str[:12]  # Use first 12 chars of UUID (without hyphens)
@@ -329,7 +329,7 @@ async def _call_model_inference(
     # If a local override is configured (e.g., port-forwarded service), use that.
     if settings.serving_local_base_url is not None:
         service_name = f"{endpoint_name_or_host}-local"
-        service_url = str(settings.serving_local_base_url).rstrip("/")
+        service_url = settings.serving_local_base_url
         namespace = "local"
         inference_url = f"{service_url}/v1/chat/completions"
     # If DNS is unreachable (e.g., external node), allow direct host/IP override.
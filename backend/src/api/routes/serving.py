@@ -525,21 +525,14 @@ def get_image_config(
         
         # Build response with all image configurations
         # Use the actual loaded images from image_config
-        train_images = {}
-        for job_type in image_config.train_images.keys():
-            job_config = image_config.train_images[job_type]
-            train_images[job_type] = {
-                "gpu": job_config.get("gpu", ""),
-                "cpu": job_config.get("cpu", ""),
-            }
+        # (flat (type, variant) tables are regrouped per type for the response)
+        train_images: dict[str, dict[str, str]] = {}
+        for (job_type, variant), image in image_config.train_images.items():
+            train_images.setdefault(job_type, {})[variant] = image
         
-        serve_images = {}
-        for serve_target in image_config.serve_images.keys():
-            serve_config = image_config.serve_images[serve_target]
-            serve_images[serve_target] = {
-                "gpu": serve_config.get("gpu", ""),
-                "cpu": serve_config.get("cpu", ""),
-            }
+        serve_images: dict[str, dict[str, str]] = {}
+        for (serve_target, variant), image in image_config.serve_images.items():
+            serve_images.setdefault(serve_target, {})[variant] = image
         
         return schemas.EnvelopeImageConfig(
             status="success",
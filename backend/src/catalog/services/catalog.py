@@ -13,7 +13,7 @@ from catalog import models as orm_models
 from catalog.repositories import DatasetRepository, ModelCatalogRepository
 from catalog.services.huggingface_importer import HuggingFaceImporter
 from core.clients.object_store import get_object_store_client
-from core.settings import get_settings
+from core.settings import get_object_store_bucket, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -356,7 +356,7 @@ class CatalogService:
 
         # Generate storage path
         settings = get_settings()
-        bucket_name = settings.object_store_bucket or settings.training_namespace
+        bucket_name = get_object_store_bucket()
         # Folder structure: models/{model_id}/{version}/
         storage_path = f"models/{model_id}/{entry.version}/"
 
@@ -399,7 +399,7 @@ class CatalogService:
             else:
                 protocol = "http"
             
-            endpoint_host = str(settings.object_store_endpoint).replace("http://", "").replace("https://", "")
+            endpoint_host = settings.object_store_endpoint.replace("http://", "").replace("https://", "")
             storage_uri = f"s3://{bucket_name}/{storage_path}"
             
             entry.storage_uri = storage_uri
@@ -19,7 +19,7 @@ from sqlalchemy.orm import Session
 from catalog import models as orm_models
 from catalog.repositories import DatasetRepository
 from core.clients.object_store import get_object_store_client
-from core.settings import get_settings
+from core.settings import get_object_store_bucket, get_settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -144,10 +144,9 @@ class DatasetService:
                 raise ValueError(f"Unsupported file format: {file_ext}. Allowed: CSV, JSONL, Parquet")
 
         # Upload to object storage
-        settings = get_settings()
         s3_client = get_object_store_client()
         # Use unified bucket per namespace
-        bucket_name = settings.object_store_bucket or settings.training_namespace
+        bucket_name = get_object_store_bucket()
         
         # Ensure bucket exists before uploading
         self._ensure_bucket_exists(s3_client, bucket_name)
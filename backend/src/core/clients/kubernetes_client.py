@@ -26,6 +26,13 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class _PrefixLoggerAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that prepends a fixed "<prefix>: " computed once at bind time."""
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        return f"{self.extra['prefix']}{msg}", kwargs
+
+
 class KubernetesClient:
     """Unified Kubernetes client for managing API connections and authentication."""
 
@@ -37,6 +44,12 @@ class KubernetesClient:
             logger_prefix: Prefix for log messages (e.g., "KServeAdapter", "ServingDeployer")
         """
         self.logger_prefix = logger_prefix
+        # Bind the prefix once so log sites don't rebuild it on every call
+        self.log: logging.LoggerAdapter = (
+            _PrefixLoggerAdapter(logger, {"prefix": f"{logger_prefix}: "})
+            if logger_prefix
+            else logging.LoggerAdapter(logger, {})
+        )
         self.settings = get_settings()
 
         # Keep references to cfg and api_client so refresh can actually update them
@@ -58,31 +71,26 @@ class KubernetesClient:
     # Internal helpers
     # -------------------------
 
-    def _log(self, level: int, msg: str) -> None:
-        prefix = f"{self.logger_prefix}: " if self.logger_prefix else ""
-        logger.log(level, f"{prefix}{msg}")
-
     def _initialize_client(self) -> None:
         """Initialize Configuration + ApiClient and API wrappers."""
         self.cfg = client.Configuration()
-        self._log(
-            logging.INFO,
+        self.log.info(
             f"kubeconfig_path={getattr(self.settings, 'kubeconfig_path', None)!r} cfg_id={id(self.cfg)} pre_load_host={self.cfg.host!r}",
         )
         try:
             if getattr(self.settings, "kubeconfig_path", None):
-                self._log(logging.INFO, f"Loading kubeconfig: {self.settings.kubeconfig_path}")
+                self.log.info(f"Loading kubeconfig: {self.settings.kubeconfig_path}")
                 k8s_config.load_kube_config(
                     config_file=self.settings.kubeconfig_path,
                     client_configuration=self.cfg,
                 )
             else:
-                self._log(logging.INFO, "Loading in-cluster config")
+                self.log.info("Loading in-cluster config")
                 k8s_config.load_incluster_config(client_configuration=self.cfg)
         except Exception as e:
-            self._log(logging.ERROR, f"Failed to load kubernetes config: {e}")
+            self.log.error(f"Failed to load kubernetes config: {e}")
             raise
-        self._log(logging.INFO, f"cfg_id={id(self.cfg)} post_load_host={self.cfg.host!r}")
+        self.log.info(f"cfg_id={id(self.cfg)} post_load_host={self.cfg.host!r}")
 
         # Apply SSL options ONLY if explicitly configured
         # (do not override what kubeconfig / incluster loader sets by default)
@@ -95,7 +103,7 @@ class KubernetesClient:
                 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         # Guard against "localhost" or empty host (means config did not apply)
-        self._log(logging.INFO, f"Kubernetes API host = {self.cfg.host!r}")
+        self.log.info(f"Kubernetes API host = {self.cfg.host!r}")
         if not self.cfg.host or "localhost" in self.cfg.host or self.cfg.host.rstrip("/") in {"http://localhost", "http://localhost:80", "https://localhost", "https://localhost:443"}:
             raise RuntimeError(
                 f"Kubernetes configuration host is invalid: {self.cfg.host!r} "
@@ -173,9 +181,9 @@ class KubernetesClient:
                         raw_token = f.read()
                     _normalize_and_set_token(cfg, raw_token)
                     cur = cfg.api_key.get("authorization")
-                    self._log(logging.INFO, f"incluster auth header refreshed: startswith_Bearer={bool(cur and cur.startswith('Bearer '))} length={len(cur) if cur else 0}")
+                    self.log.info(f"incluster auth header refreshed: startswith_Bearer={bool(cur and cur.startswith('Bearer '))} length={len(cur) if cur else 0}")
             except Exception as e:
-                self._log(logging.WARNING, f"token refresh hook failed: {e}")
+                self.log.warning(f"token refresh hook failed: {e}")
 
         # Also normalize whatever the loader may have put into cfg.
         try:
@@ -183,7 +191,7 @@ class KubernetesClient:
             if existing:
                 _normalize_and_set_token(self.cfg, existing)
                 cur = self.cfg.api_key.get("authorization")
-                self._log(logging.INFO, f"incluster auth header normalized: startswith_Bearer={bool(cur and cur.startswith('Bearer '))} length={len(cur) if cur else 0}")
+                self.log.info(f"incluster auth header normalized: startswith_Bearer={bool(cur and cur.startswith('Bearer '))} length={len(cur) if cur else 0}")
         except Exception:
             pass
 
@@ -219,7 +227,7 @@ class KubernetesClient:
         # If kubeconfig_path is set, we're using external kubeconfig (not in-cluster)
         # Skip service account file validation in this case
         if getattr(self.settings, "kubeconfig_path", None):
-            self._log(logging.DEBUG, "Using external kubeconfig, skipping in-cluster service account file validation")
+            self.log.debug("Using external kubeconfig, skipping in-cluster service account file validation")
         else:
             token_path = "/var/run/secrets/kubernetes.io/serviceaccount/token"
             ca_cert_path = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
@@ -234,16 +242,16 @@ class KubernetesClient:
                         token_content = f.read().strip()
                     if token_content:
                         results["token_readable"] = True
-                        self._log(logging.DEBUG, f"Service account token length: {len(token_content)}")
+                        self.log.debug(f"Service account token length: {len(token_content)}")
                 except Exception as e:
-                    self._log(logging.WARNING, f"Could not read service account token: {e}")
+                    self.log.warning(f"Could not read service account token: {e}")
 
             if os.path.exists(namespace_path):
                 try:
                     with open(namespace_path, "r") as f:
                         results["namespace"] = f.read().strip()
                 except Exception as e:
-                    self._log(logging.WARNING, f"Could not read namespace: {e}")
+                    self.log.warning(f"Could not read namespace: {e}")
 
         # Test API permissions (always perform, regardless of kubeconfig_path)
         try:
@@ -251,7 +259,7 @@ class KubernetesClient:
             self.core_api.list_namespace(limit=1, _request_timeout=5)
             results["can_list_namespaces"] = True
         except Exception as e:
-            self._log(logging.DEBUG, f"Permission test (list_namespaces) failed: {e}")
+            self.log.debug(f"Permission test (list_namespaces) failed: {e}")
 
         # Test KServe access (always perform, regardless of kubeconfig_path)
         try:
@@ -265,72 +273,71 @@ class KubernetesClient:
             )
             results["can_access_kserve"] = True
         except Exception as e:
-            self._log(logging.DEBUG, f"Permission test (KServe) failed: {e}")
+            self.log.debug(f"Permission test (KServe) failed: {e}")
 
         return results
 
     def _test_connection(self) -> None:
         """Test Kubernetes API connection and validate service account."""
         try:
-            self._log(logging.INFO, "Testing Kubernetes API connection...")
+            self.log.info("Testing Kubernetes API connection...")
 
             validation_results = self._validate_service_account()
 
             # Log service account status (only for in-cluster config)
             if not getattr(self.settings, "kubeconfig_path", None):
                 if validation_results["token_exists"]:
-                    self._log(logging.INFO, "Service account token found")
+                    self.log.info("Service account token found")
                     if validation_results["token_readable"]:
-                        self._log(logging.INFO, "Service account token is readable")
+                        self.log.info("Service account token is readable")
                     else:
-                        self._log(logging.WARNING, "Service account token exists but is not readable")
+                        self.log.warning("Service account token exists but is not readable")
                 else:
-                    self._log(logging.ERROR, "Service account token NOT found - this will cause 401 errors in-cluster")
-                    self._log(
-                        logging.ERROR,
+                    self.log.error("Service account token NOT found - this will cause 401 errors in-cluster")
+                    self.log.error(
                         "Ensure Pod spec has 'automountServiceAccountToken: true' and serviceAccountName is set",
                     )
 
                 if validation_results["ca_cert_exists"]:
-                    self._log(logging.INFO, "Service account CA certificate found")
+                    self.log.info("Service account CA certificate found")
                 else:
-                    self._log(logging.WARNING, "Service account CA certificate NOT found")
+                    self.log.warning("Service account CA certificate NOT found")
 
                 if validation_results["namespace"]:
-                    self._log(logging.INFO, f"Current namespace: {validation_results['namespace']}")
+                    self.log.info(f"Current namespace: {validation_results['namespace']}")
 
             # Test connection by listing namespaces
             assert self.core_api is not None
             _ = self.core_api.list_namespace(limit=1, _request_timeout=10)
 
-            self._log(logging.INFO, "Kubernetes API connection successful. Cluster accessible (tested via namespace list)")
+            self.log.info("Kubernetes API connection successful. Cluster accessible (tested via namespace list)")
 
             if validation_results["can_list_namespaces"]:
-                self._log(logging.INFO, "RBAC permission verified: can list namespaces")
+                self.log.info("RBAC permission verified: can list namespaces")
             else:
-                self._log(logging.WARNING, "RBAC permission check failed: cannot list namespaces")
+                self.log.warning("RBAC permission check failed: cannot list namespaces")
 
             if validation_results["can_access_kserve"]:
-                self._log(logging.INFO, "RBAC permission verified: can access KServe InferenceServices")
+                self.log.info("RBAC permission verified: can access KServe InferenceServices")
             else:
-                self._log(logging.WARNING, "RBAC permission check failed: cannot access KServe InferenceServices")
+                self.log.warning("RBAC permission check failed: cannot access KServe InferenceServices")
 
         except ApiException as e:
             if e.status == 401:
                 self._handle_401_during_test(e)
             else:
-                self._log(logging.WARNING, f"Failed to connect to Kubernetes API (status {e.status}): {e.reason}")
+                self.log.warning(f"Failed to connect to Kubernetes API (status {e.status}): {e.reason}")
 
         except Exception as e:
-            self._log(logging.WARNING, f"Failed to test Kubernetes API connection: {e}")
+            self.log.warning(f"Failed to test Kubernetes API connection: {e}")
 
     def _handle_401_during_test(self, e: ApiException) -> None:
         """Detailed diagnostics for 401 during initialization test."""
         validation_results = self._validate_service_account()
 
-        self._log(logging.ERROR, "Kubernetes API authentication failed (401 Unauthorized)")
+        self.log.error("Kubernetes API authentication failed (401 Unauthorized)")
         logger.error("=" * 80)
-        logger.error(f"{self.logger_prefix}: DIAGNOSTIC INFORMATION FOR 401 ERROR" if self.logger_prefix else "DIAGNOSTIC INFORMATION FOR 401 ERROR")
+        self.log.error("DIAGNOSTIC INFORMATION FOR 401 ERROR")
         logger.error("=" * 80)
 
         if not getattr(self.settings, "kubeconfig_path", None):
@@ -373,22 +380,22 @@ class KubernetesClient:
         logger.error("=" * 80)
 
         # Attempt refresh and retry once
-        self._log(logging.WARNING, "Attempting config/token refresh...")
+        self.log.warning("Attempting config/token refresh...")
         if self.refresh_token():
-            self._log(logging.INFO, "Refresh succeeded, retrying connection test...")
+            self.log.info("Refresh succeeded, retrying connection test...")
             try:
                 assert self.core_api is not None
                 _ = self.core_api.list_namespace(limit=1, _request_timeout=10)
-                self._log(logging.INFO, "Kubernetes API connection successful after refresh.")
+                self.log.info("Kubernetes API connection successful after refresh.")
                 return
             except ApiException as retry_e:
-                self._log(logging.ERROR, f"Connection test still failed after refresh: {retry_e}")
+                self.log.error(f"Connection test still failed after refresh: {retry_e}")
             except Exception as retry_e:
-                self._log(logging.ERROR, f"Connection test still failed after refresh: {retry_e}")
+                self.log.error(f"Connection test still failed after refresh: {retry_e}")
         else:
-            self._log(logging.ERROR, "Refresh failed during initialization")
+            self.log.error("Refresh failed during initialization")
 
-        self._log(logging.ERROR, f"Final: 401 Unauthorized. Error: {e.reason}")
+        self.log.error(f"Final: 401 Unauthorized. Error: {e.reason}")
 
     # -------------------------
     # Public token refresh
@@ -400,11 +407,11 @@ class KubernetesClient:
         IMPORTANT: refresh must update the SAME configuration/api_client used by this instance.
         """
         if self.cfg is None:
-            self._log(logging.ERROR, "Cannot refresh: cfg is not initialized")
+            self.log.error("Cannot refresh: cfg is not initialized")
             return False
 
         try:
-            self._log(logging.INFO, "Refreshing Kubernetes authentication/config...")
+            self.log.info("Refreshing Kubernetes authentication/config...")
 
             if getattr(self.settings, "kubeconfig_path", None):
                 k8s_config.load_kube_config(
@@ -420,11 +427,11 @@ class KubernetesClient:
             # Rebuild api_client + APIs to ensure new cfg is used
             self._rebuild_clients()
 
-            self._log(logging.INFO, "Refresh success")
+            self.log.info("Refresh success")
             return True
 
         except Exception as e:
-            self._log(logging.ERROR, f"Failed to refresh Kubernetes config/token: {e}")
+            self.log.error(f"Failed to refresh Kubernetes config/token: {e}")
             return False
 
     # -------------------------
@@ -443,11 +450,11 @@ class KubernetesClient:
             yield
         except ApiException as e:
             if e.status == 401:
-                self._log(logging.WARNING, f"401 during {operation_name}. Attempting refresh...")
+                self.log.warning(f"401 during {operation_name}. Attempting refresh...")
                 if self.refresh_token():
-                    self._log(logging.INFO, f"Refresh OK. Please retry {operation_name}.")
+                    self.log.info(f"Refresh OK. Please retry {operation_name}.")
                 else:
-                    self._log(logging.ERROR, f"Refresh failed. Cannot retry {operation_name}.")
+                    self.log.error(f"Refresh failed. Cannot retry {operation_name}.")
                 raise
             raise
 
@@ -471,10 +478,10 @@ class KubernetesClient:
                 return api_call()
             except ApiException as e:
                 if e.status == 401 and retries < max_retries:
-                    self._log(logging.WARNING, f"401 during {operation_name}. Attempting refresh...")
+                    self.log.warning(f"401 during {operation_name}. Attempting refresh...")
                     if self.refresh_token():
                         retries += 1
-                        self._log(logging.INFO, f"Retrying {operation_name} (attempt {retries}/{max_retries})...")
+                        self.log.info(f"Retrying {operation_name} (attempt {retries}/{max_retries})...")
                         continue
-                    self._log(logging.ERROR, f"Refresh failed. Cannot retry {operation_name}.")
+                    self.log.error(f"Refresh failed. Cannot retry {operation_name}.")
                 raise
\ No newline at end of file
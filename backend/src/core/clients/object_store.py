@@ -30,7 +30,7 @@ def get_object_store_client():
         )
         _client = boto3.client(
             "s3",
-            endpoint_url=str(settings.object_store_endpoint),
+            endpoint_url=settings.object_store_endpoint,
             aws_access_key_id=settings.object_store_access_key,
             aws_secret_access_key=settings.object_store_secret_key.get_secret_value(),
             use_ssl=settings.object_store_secure,
@@ -12,7 +12,7 @@ def get_redis_client() -> redis.Redis:
     if _client is None:
         settings = get_settings()
         _client = redis.from_url(
-            str(settings.redis_url),
+            settings.redis_url,
             encoding="utf-8",
             decode_responses=True,
         )
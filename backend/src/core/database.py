@@ -19,8 +19,7 @@ class Base(DeclarativeBase):
 
 def _create_engine():
     settings = get_settings()
-    # Convert AnyUrl to string for SQLAlchemy
-    database_url_str = str(settings.database_url)
+    database_url_str = settings.database_url
     
     # Connection pool settings for better reliability
     engine = create_engine(
@@ -28,8 +27,8 @@ def _create_engine():
         echo=settings.sqlalchemy_echo,
         future=True,
         # Connection pool settings
-        pool_size=5,  # Number of connections to maintain
-        max_overflow=10,  # Maximum number of connections beyond pool_size
+        pool_size=settings.db_pool_size,  # Number of connections to maintain
+        max_overflow=settings.db_max_overflow,  # Maximum number of connections beyond pool_size
         pool_pre_ping=True,  # Verify connections before using (handles stale connections)
         pool_recycle=3600,  # Recycle connections after 1 hour
         connect_args={
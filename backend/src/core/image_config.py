@@ -4,116 +4,142 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Dict, Optional
-from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# NVML is initialized at most once per process; nvmlInit() is the expensive call.
+_nvml_initialized: bool = False
+
+
+def _nvml_device_count() -> int:
+    """Return the number of NVIDIA devices visible through NVML (0 if unavailable)."""
+    global _nvml_initialized
+    try:
+        import pynvml  # provided by nvidia-ml-py
+    except ImportError:
+        return 0
+
+    try:
+        if not _nvml_initialized:
+            pynvml.nvmlInit()
+            _nvml_initialized = True
+        return pynvml.nvmlDeviceGetCount()
+    except pynvml.NVMLError as e:
+        logger.debug(f"NVML unavailable: {e}")
+        return 0
+
+
+# Default image mappings (from training-serving-spec.md)
+# Built once at import and shared read-only by every ImageConfig instance.
+# Flat (type, variant) -> image tables: one hash lookup per image resolution.
+# These are placeholder values - override with environment variables in .env file
+# See env.example for configuration examples
+# 
+# Environment variable format:
+#   TRAIN_IMAGE_{JOB_TYPE}_{GPU|CPU}=<image:tag>
+#   SERVE_IMAGE_{SERVE_TARGET}_{GPU|CPU}=<image:tag>
+#
+# Example training images:
+#   - PyTorch base: pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime (GPU)
+#   - PyTorch CPU: pytorch/pytorch:2.1.0-cpu (CPU)
+#   - Custom registry: registry.example.com/llm-train-sft:pytorch2.1-cuda12.1-v1
+#
+# Example serving images:
+#   - TGI (HuggingFace): ghcr.io/huggingface/text-generation-inference:latest (GPU/CPU)
+#   - vLLM: ghcr.io/vllm/vllm:latest (GPU, CPU support limited)
+#   - Custom registry: Override via SERVE_IMAGE_{SERVE_TARGET}_{GPU|CPU} env vars
+_PYTORCH_GPU = "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime"  # PyTorch official image with CUDA 12.1
+_PYTORCH_CPU = "pytorch/pytorch:2.1.0-cpu"  # PyTorch official CPU image
+
+DEFAULT_TRAIN_IMAGES: Mapping[tuple[str, str], str] = MappingProxyType({
+    ("PRETRAIN", "gpu"): _PYTORCH_GPU,
+    ("PRETRAIN", "cpu"): _PYTORCH_CPU,
+    ("SFT", "gpu"): _PYTORCH_GPU,
+    ("SFT", "cpu"): _PYTORCH_CPU,
+    ("RAG_TUNING", "gpu"): _PYTORCH_GPU,
+    ("RAG_TUNING", "cpu"): _PYTORCH_CPU,
+    ("RLHF", "gpu"): _PYTORCH_GPU,
+    ("RLHF", "cpu"): _PYTORCH_CPU,
+    ("EMBEDDING", "gpu"): _PYTORCH_GPU,
+    ("EMBEDDING", "cpu"): _PYTORCH_CPU,
+})
+
+DEFAULT_SERVE_IMAGES: Mapping[tuple[str, str], str] = MappingProxyType({
+    # GPU: TGI (Text Generation Inference) for HuggingFace models
+    ("GENERATION", "gpu"): "ghcr.io/huggingface/text-generation-inference:latest",
+    # CPU: TGI also supports CPU (though GPU is recommended)
+    ("GENERATION", "cpu"): "ghcr.io/huggingface/text-generation-inference:latest",
+    # RAG: vLLM for RAG workloads
+    ("RAG", "gpu"): "ghcr.io/vllm/vllm:latest",
+    # CPU: vLLM CPU support (limited, GPU recommended)
+    ("RAG", "cpu"): "ghcr.io/vllm/vllm:latest",
+})
+
+# Supported job types / serve targets, in declaration order
+TRAIN_JOB_TYPES: tuple[str, ...] = tuple(dict.fromkeys(job_type for job_type, _ in DEFAULT_TRAIN_IMAGES))
+SERVE_TARGETS: tuple[str, ...] = tuple(dict.fromkeys(target for target, _ in DEFAULT_SERVE_IMAGES))
+# Pre-joined for error messages
+_TRAIN_JOB_TYPES_STR = ", ".join(TRAIN_JOB_TYPES)
+_SERVE_TARGETS_STR = ", ".join(SERVE_TARGETS)
 
 class ImageConfig:
     """
     Manages container image versions based on training-serving-spec.md.
     
-    Image mappings:
+    Image mappings (flat, keyed by (type, variant)):
     - train: PRETRAIN, SFT, RAG_TUNING, RLHF, EMBEDDING → gpu/cpu variants
     - serve: GENERATION, RAG → gpu/cpu variants
     
     Configuration source: ConfigMap, environment variables, or default values
     """
 
-    # Default image mappings (from training-serving-spec.md)
-    # These are placeholder values - override with environment variables in .env file
-    # See env.example for configuration examples
-    # 
-    # Environment variable format:
-    #   TRAIN_IMAGE_{JOB_TYPE}_{GPU|CPU}=<image:tag>
-    #   SERVE_IMAGE_{SERVE_TARGET}_{GPU|CPU}=<image:tag>
-    #
-    # Example training images:
-    #   - PyTorch base: pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime (GPU)
-    #   - PyTorch CPU: pytorch/pytorch:2.1.0-cpu (CPU)
-    #   - Custom registry: registry.example.com/llm-train-sft:pytorch2.1-cuda12.1-v1
-    #
-    # Example serving images:
-    #   - TGI (HuggingFace): ghcr.io/huggingface/text-generation-inference:latest (GPU/CPU)
-    #   - vLLM: ghcr.io/vllm/vllm:latest (GPU, CPU support limited)
-    #   - Custom registry: Override via SERVE_IMAGE_{SERVE_TARGET}_{GPU|CPU} env vars
-    DEFAULT_TRAIN_IMAGES: Dict[str, Dict[str, str]] = {
-        "PRETRAIN": {
-            # GPU: PyTorch official image with CUDA 12.1
-            "gpu": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
-            # CPU: PyTorch official CPU image
-            "cpu": "pytorch/pytorch:2.1.0-cpu",
-        },
-        "SFT": {
-            # GPU: PyTorch official image with CUDA 12.1
-            "gpu": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
-            # CPU: PyTorch official CPU image
-            "cpu": "pytorch/pytorch:2.1.0-cpu",
-        },
-        "RAG_TUNING": {
-            # GPU: PyTorch official image with CUDA 12.1
-            "gpu": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
-            # CPU: PyTorch official CPU image
-            "cpu": "pytorch/pytorch:2.1.0-cpu",
-        },
-        "RLHF": {
-            # GPU: PyTorch official image with CUDA 12.1
-            "gpu": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
-            # CPU: PyTorch official CPU image
-            "cpu": "pytorch/pytorch:2.1.0-cpu",
-        },
-        "EMBEDDING": {
-            # GPU: PyTorch official image with CUDA 12.1
-            "gpu": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
-            # CPU: PyTorch official CPU image
-            "cpu": "pytorch/pytorch:2.1.0-cpu",
-        },
-    }
+    # Shared read-only defaults (see module-level constants above)
+    DEFAULT_TRAIN_IMAGES = DEFAULT_TRAIN_IMAGES
+    DEFAULT_SERVE_IMAGES = DEFAULT_SERVE_IMAGES
 
-    DEFAULT_SERVE_IMAGES: Dict[str, Dict[str, str]] = {
-        "GENERATION": {
-            # GPU: TGI (Text Generation Inference) for HuggingFace models
-            "gpu": "ghcr.io/huggingface/text-generation-inference:latest",
-            # CPU: TGI also supports CPU (though GPU is recommended)
-            "cpu": "ghcr.io/huggingface/text-generation-inference:latest",
-        },
-        "RAG": {
-            # RAG: vLLM for RAG workloads
-            "gpu": "ghcr.io/vllm/vllm:latest",
-            # CPU: vLLM CPU support (limited, GPU recommended)
-            "cpu": "ghcr.io/vllm/vllm:latest",
-        },
+    # Environment variable names per (type, variant), built once at class creation
+    _TRAIN_ENV_KEYS: Dict[tuple[str, str], str] = {
+        (job_type, variant): f"TRAIN_IMAGE_{job_type}_{variant.upper()}"
+        for job_type, variant in DEFAULT_TRAIN_IMAGES
     }
-    
+    _SERVE_ENV_KEYS: Dict[tuple[str, str], str] = {
+        (serve_target, variant): f"SERVE_IMAGE_{serve_target}_{variant.upper()}"
+        for serve_target, variant in DEFAULT_SERVE_IMAGES
+    }
+
     def __init__(self):
         """Initialize image configuration from environment variables or defaults."""
         self.train_images = self._load_train_images()
         self.serve_images = self._load_serve_images()
+        # Cached result of the GPU probe (None until first is_gpu_available() call)
+        self._gpu_available: Optional[bool] = None
+        # Injected device env vars settle GPU presence without probing
+        environ = os.environ
+        self._gpu_hint = "NVIDIA_VISIBLE_DEVICES" in environ or "CUDA_VISIBLE_DEVICES" in environ
 
-    def _load_train_images(self) -> Dict[str, Dict[str, str]]:
-        """Load training images from environment or use defaults."""
-        images = {}
-        for job_type in self.DEFAULT_TRAIN_IMAGES:
-            gpu_key = f"TRAIN_IMAGE_{job_type}_GPU"
-            cpu_key = f"TRAIN_IMAGE_{job_type}_CPU"
-            images[job_type] = {
-                "gpu": os.getenv(gpu_key, self.DEFAULT_TRAIN_IMAGES[job_type]["gpu"]),
-                "cpu": os.getenv(cpu_key, self.DEFAULT_TRAIN_IMAGES[job_type]["cpu"]),
-            }
+    @staticmethod
+    def _load_images(
+        defaults: Mapping[tuple[str, str], str],
+        env_keys: Dict[tuple[str, str], str],
+    ) -> Dict[tuple[str, str], str]:
+        """Resolve env overrides against the flat defaults table in a single pass."""
+        environ = os.environ
+        images = dict(defaults)
+        for key, env_key in env_keys.items():
+            image = environ.get(env_key)
+            if image is not None:
+                images[key] = image
         return images
 
-    def _load_serve_images(self) -> Dict[str, Dict[str, str]]:
+    def _load_train_images(self) -> Dict[tuple[str, str], str]:
+        """Load training images from environment or use defaults."""
+        return self._load_images(self.DEFAULT_TRAIN_IMAGES, self._TRAIN_ENV_KEYS)
+
+    def _load_serve_images(self) -> Dict[tuple[str, str], str]:
         """Load serving images from environment or use defaults."""
-        images = {}
-        for serve_target in self.DEFAULT_SERVE_IMAGES:
-            gpu_key = f"SERVE_IMAGE_{serve_target}_GPU"
-            cpu_key = f"SERVE_IMAGE_{serve_target}_CPU"
-            images[serve_target] = {
-                "gpu": os.getenv(gpu_key, self.DEFAULT_SERVE_IMAGES[serve_target]["gpu"]),
-                "cpu": os.getenv(cpu_key, self.DEFAULT_SERVE_IMAGES[serve_target]["cpu"]),
-            }
-        return images
+        return self._load_images(self.DEFAULT_SERVE_IMAGES, self._SERVE_ENV_KEYS)
 
     def get_train_image(self, job_type: str, use_gpu: bool = True) -> str:
         """
@@ -129,14 +155,13 @@ class ImageConfig:
         Raises:
             ValueError: If job_type is not supported
         """
-        if job_type not in self.train_images:
+        try:
+            return self.train_images[(job_type, "gpu" if use_gpu else "cpu")]
+        except KeyError:
             raise ValueError(
                 f"Unsupported job_type: {job_type}. "
-                f"Supported types: {', '.join(self.train_images.keys())}"
-            )
-
-        variant = "gpu" if use_gpu else "cpu"
-        return self.train_images[job_type][variant]
+                f"Supported types: {_TRAIN_JOB_TYPES_STR}"
+            ) from None
 
     def get_serve_image(self, serve_target: str, use_gpu: bool = True) -> str:
         """
@@ -152,35 +177,30 @@ class ImageConfig:
         Raises:
             ValueError: If serve_target is not supported
         """
-        if serve_target not in self.serve_images:
+        try:
+            return self.serve_images[(serve_target, "gpu" if use_gpu else "cpu")]
+        except KeyError:
             raise ValueError(
                 f"Unsupported serve_target: {serve_target}. "
-                f"Supported targets: {', '.join(self.serve_images.keys())}"
-            )
-
-        variant = "gpu" if use_gpu else "cpu"
-        return self.serve_images[serve_target][variant]
+                f"Supported targets: {_SERVE_TARGETS_STR}"
+            ) from None
 
     def is_gpu_available(self) -> bool:
         """
         Detect GPU availability in the environment.
+
+        The probe runs at most once per instance; the result is cached.
         
         Returns:
             True if GPU is available, False otherwise
         """
-        # Check for NVIDIA GPU
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["nvidia-smi"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            pass
+        if self._gpu_available is None:
+            self._gpu_available = self._detect_gpu()
+        return self._gpu_available
 
+    @staticmethod
+    def _detect_gpu() -> bool:
+        """Probe for a GPU, checking cheap env vars before querying NVML."""
         # Check for CUDA environment variable
         if os.getenv("CUDA_VISIBLE_DEVICES") is not None:
             return True
@@ -189,7 +209,8 @@ class ImageConfig:
         if os.getenv("NVIDIA_VISIBLE_DEVICES") is not None:
             return True
 
-        return False
+        # Check for NVIDIA GPU via NVML (no nvidia-smi fork/exec)
+        return _nvml_device_count() > 0
 
     def get_train_image_with_fallback(self, job_type: str, use_gpu: bool = True) -> str:
         """
@@ -202,7 +223,7 @@ class ImageConfig:
         Returns:
             Container image string (CPU variant if GPU requested but unavailable)
         """
-        if use_gpu and not self.is_gpu_available():
+        if use_gpu and not self._gpu_hint and not self.is_gpu_available():
             logger.warning(
                 f"GPU requested for {job_type} but GPU not available. "
                 "Falling back to CPU image."
@@ -221,7 +242,7 @@ class ImageConfig:
         Returns:
             Container image string (CPU variant if GPU requested but unavailable)
         """
-        if use_gpu and not self.is_gpu_available():
+        if use_gpu and not self._gpu_hint and not self.is_gpu_available():
             logger.warning(
                 f"GPU requested for {serve_target} but GPU not available. "
                 "Falling back to CPU image."
@@ -230,8 +251,13 @@ class ImageConfig:
         return self.get_serve_image(serve_target, use_gpu=use_gpu)
 
 
-@lru_cache()
+_image_config: Optional[ImageConfig] = None
+
+
 def get_image_config() -> ImageConfig:
-    """Get cached ImageConfig instance."""
-    return ImageConfig()
+    """Get the process-wide ImageConfig instance (created on first call)."""
+    global _image_config
+    if _image_config is None:
+        _image_config = ImageConfig()
+    return _image_config
 
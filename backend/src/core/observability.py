@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import logging
+import sys
 import time
 
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from prometheus_client import Counter, Histogram
 
-from core.settings import get_settings
+from core.settings import Settings, get_settings
 
 REQUEST_COUNT = Counter(
     "llm_ops_request_total",
@@ -24,20 +23,26 @@ REQUEST_LATENCY = Histogram(
 )
 
 
-def setup_logging() -> None:
-    """Setup logging configuration from settings."""
-    settings = get_settings()
-    
-    # Map string log level to logging constant
-    log_level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    
-    log_level = log_level_map.get(settings.log_level.upper(), logging.INFO)
+# Interned HTTP method names: label keys reuse one string object (and its cached hash)
+_METHOD_INTERN = {
+    m: sys.intern(m) for m in ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+}
+
+# Map string log level to logging constant
+LOG_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def setup_logging(settings: Settings | None = None) -> None:
+    """Setup logging configuration from settings (resolved via get_settings() if omitted)."""
+    if settings is None:
+        settings = get_settings()
+    log_level = LOG_LEVEL_MAP.get(settings.log_level.upper(), logging.INFO)
     
     logging.basicConfig(
         level=log_level,
@@ -45,23 +50,56 @@ def setup_logging() -> None:
     )
 
 
-class ObservabilityMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+class ObservabilityMiddleware:
+    """Pure ASGI middleware recording request count and latency per route."""
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        start_time = time.perf_counter()
-        response = await call_next(request)
-        elapsed = time.perf_counter() - start_time
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Bound metric children per label tuple, so labels() runs once per series
+        self._latency_children: dict[tuple[str, str], Histogram] = {}
+        self._count_children: dict[tuple[str, str, int], Counter] = {}
 
-        route = request.url.path
-        REQUEST_LATENCY.labels(request.method, route).observe(elapsed)
-        REQUEST_COUNT.labels(request.method, route, response.status_code).inc()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_ns = time.monotonic_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Recorded even when the app raises, so failing requests count as 500s
+            elapsed = (time.monotonic_ns() - start_ns) * 1e-9
+
+            # Use the matched route template (e.g. /jobs/{job_id}) to bound label cardinality
+            matched_route = scope.get("route")
+            route = matched_route.path if matched_route is not None else scope["path"]
+            method = scope["method"]
+            method = _METHOD_INTERN.get(method, method)
+            latency_key = (method, route)
+            latency = self._latency_children.get(latency_key)
+            if latency is None:
+                latency = self._latency_children[latency_key] = REQUEST_LATENCY.labels(*latency_key)
+            latency.observe(elapsed)
+
+            count_key = (method, route, status_code)
+            count = self._count_children.get(count_key)
+            if count is None:
+                count = self._count_children[count_key] = REQUEST_COUNT.labels(*count_key)
+            count.inc()
 
 
 def add_observability(app: FastAPI) -> None:
-    setup_logging()
+    settings = get_settings()
+    setup_logging(settings)
+    app.state.settings = settings
     app.add_middleware(ObservabilityMiddleware)
 
@@ -1,62 +1,107 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+from functools import lru_cache
+from typing import AbstractSet
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# API paths that bypass RBAC (documentation and health probes)
+_SKIP_PATHS = frozenset({
+    "/llm-ops/v1/docs",
+    "/llm-ops/v1/openapi.json",
+    "/llm-ops/v1/redoc",
+})
+_SKIP_PREFIXES = ("/llm-ops/v1/health",)
+
+# Identity header names as they appear in scope["headers"] (lower-case bytes)
+_USER_ID_HEADER = b"x-user-id"
+_USER_ROLES_HEADER = b"x-user-roles"
+
+# Pre-encoded rejection bodies in the standard {status, message, data} envelope
+_UNAUTHORIZED_BODY = b'{"status":"fail","message":"Missing identity headers","data":null}'
+_FORBIDDEN_BODY = b'{"status":"fail","message":"Access denied by policy","data":null}'
+
+
+@lru_cache(maxsize=1024)
+def _parse_roles(header: str) -> frozenset[str]:
+    """Parse a comma-separated X-User-Roles header; clients resend the same few values."""
+    return frozenset(role for role in (part.strip() for part in header.split(",")) if role)
+
 
 class PolicyEngine:
     """Placeholder policy evaluation. Real implementation will query governance tables."""
 
+    __slots__ = ("_required_role",)
+
     def __init__(self):
-        self.settings = get_settings()
+        self._required_role = get_settings().default_required_role
+
+    def is_allowed(self, actor_id: str, roles: AbstractSet[str], method: str, path: str) -> bool:
+        # additional policy checks (actor/method/path) will be added when governance service is available
+        return self._required_role in roles
+
 
-    def is_allowed(self, actor_id: str, roles: Sequence[str], method: str, path: str) -> bool:
-        if self.settings.default_required_role not in roles:
-            return False
-        # additional policy checks will be added when governance service is available
-        return True
+async def _reject(send: Send, status_code: int, body: bytes) -> None:
+    """Send a complete JSON rejection without going through a Response object."""
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        # Fresh header list per response: the message is handed to the server, so
+        # a shared module-level list could be aliased across concurrent responses
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
 
 
-class RBACMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, policy_engine: PolicyEngine | None = None):
-        super().__init__(app)
+class RBACMiddleware:
+    """Pure ASGI middleware enforcing identity headers and policy on /llm-ops/v1 endpoints."""
+
+    def __init__(self, app: ASGIApp, policy_engine: PolicyEngine | None = None):
+        self.app = app
         self.policy_engine = policy_engine or PolicyEngine()
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        # Apply RBAC only to API endpoints (/llm-ops/v1/*)
-        # Skip all non-API paths (frontend, static files, docs, health, etc.)
-        if not request.url.path.startswith("/llm-ops/v1"):
-            return await call_next(request)
-
-        # For API endpoints, check if it's a documentation or health endpoint to skip
-        skip_api_paths = [
-            "/llm-ops/v1/docs",
-            "/llm-ops/v1/openapi.json",
-            "/llm-ops/v1/redoc",
-        ]
-        if request.url.path in skip_api_paths or request.url.path.startswith("/llm-ops/v1/health"):
-            return await call_next(request)
-        
-        actor_id = request.headers.get("X-User-Id")
-        role_header = request.headers.get("X-User-Roles", "")
-        roles = [role.strip() for role in role_header.split(",") if role.strip()]
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Apply RBAC only to API endpoints (/llm-ops/v1/*), minus docs and health probes.
+        # Decided from the path alone, before any header is touched.
+        path = scope["path"]
+        if not path.startswith("/llm-ops/v1") or path in _SKIP_PATHS or path.startswith(_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        # ASGI header names are already lower-case bytes; only decode the two we need
+        actor_id = role_header = None
+        for name, value in scope["headers"]:
+            if name == _USER_ID_HEADER:
+                if actor_id is None:
+                    actor_id = value.decode("latin-1")
+            elif name == _USER_ROLES_HEADER:
+                if role_header is None:
+                    role_header = value.decode("latin-1")
+        roles = _parse_roles(role_header or "")
 
         if not actor_id or not roles:
-            raise HTTPException(status_code=401, detail="Missing identity headers")
-
-        request.state.actor_id = actor_id
-        request.state.roles = roles
+            await _reject(send, 401, _UNAUTHORIZED_BODY)
+            return
 
-        if not self.policy_engine.is_allowed(actor_id, roles, request.method, request.url.path):
-            raise HTTPException(status_code=403, detail="Access denied by policy")
+        # Exposed to handlers as request.state.actor_id / request.state.roles
+        state = scope.setdefault("state", {})
+        state["actor_id"] = actor_id
+        state["roles"] = roles
 
-        return await call_next(request)
+        if not self.policy_engine.is_allowed(actor_id, roles, scope["method"], path):
+            await _reject(send, 403, _FORBIDDEN_BODY)
+            return
 
+        await self.app(scope, receive, send)
@@ -1,9 +1,11 @@
 """Repositories for governance, audit, and cost entities."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 
 from catalog import models as catalog_models
@@ -21,7 +23,6 @@ class GovernancePolicyRepository:
         """Persist a new governance policy."""
         self.session.add(policy)
         self.session.commit()
-        self.session.refresh(policy)
         return policy
 
     def get(self, policy_id: str | UUID) -> Optional[catalog_models.GovernancePolicy]:
@@ -50,7 +51,6 @@ class GovernancePolicyRepository:
     ) -> catalog_models.GovernancePolicy:
         """Update an existing governance policy."""
         self.session.commit()
-        self.session.refresh(policy)
         return policy
 
     def delete(self, policy: catalog_models.GovernancePolicy) -> None:
@@ -69,7 +69,6 @@ class AuditLogRepository:
         """Persist a new audit log entry."""
         self.session.add(log)
         self.session.commit()
-        self.session.refresh(log)
         return log
 
     def list(
@@ -78,17 +77,25 @@ class AuditLogRepository:
         resource_type: Optional[str] = None,
         action: Optional[str] = None,
         limit: int = 100,
+        cursor: Optional[tuple[datetime, UUID]] = None,
     ) -> Sequence[catalog_models.AuditLog]:
-        """List audit logs with optional filters."""
-        query = self.session.query(catalog_models.AuditLog)
+        """List audit logs, newest first, with optional filters.
+
+        Pagination is keyset-based: pass the (occurred_at, id) of the last row of the
+        previous page as ``cursor`` to fetch the rows strictly after it.
+        """
+        log = catalog_models.AuditLog
+        query = self.session.query(log)
         if actor_id:
-            query = query.filter(catalog_models.AuditLog.actor_id == actor_id)
+            query = query.filter(log.actor_id == actor_id)
         if resource_type:
-            query = query.filter(catalog_models.AuditLog.resource_type == resource_type)
+            query = query.filter(log.resource_type == resource_type)
         if action:
-            query = query.filter(catalog_models.AuditLog.action == action)
+            query = query.filter(log.action == action)
+        if cursor:
+            query = query.filter(tuple_(log.occurred_at, log.id) < tuple_(*cursor))
         return (
-            query.order_by(catalog_models.AuditLog.occurred_at.desc())
+            query.order_by(log.occurred_at.desc(), log.id.desc())
             .limit(limit)
             .all()
         )
@@ -104,7 +111,6 @@ class CostProfileRepository:
         """Persist a new cost profile."""
         self.session.add(profile)
         self.session.commit()
-        self.session.refresh(profile)
         return profile
 
     def list(
@@ -123,3 +129,28 @@ class CostProfileRepository:
             query = query.filter(catalog_models.CostProfile.time_window == time_window)
         return query.order_by(catalog_models.CostProfile.created_at.desc()).all()
 
+    def aggregate(
+        self,
+        resource_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> tuple[float, int, float, int]:
+        """Sum GPU hours, tokens and cost over matching profiles in one query.
+
+        Returns (gpu_hours, token_count, cost_amount, profile_count); NULL columns count as 0.
+        """
+        profile = catalog_models.CostProfile
+        query = self.session.query(
+            func.coalesce(func.sum(profile.gpu_hours), 0),
+            func.coalesce(func.sum(profile.token_count), 0),
+            func.coalesce(func.sum(profile.cost_amount), 0),
+            func.count(profile.id),
+        )
+        if resource_type:
+            query = query.filter(profile.resource_type == resource_type)
+        if start_date:
+            query = query.filter(profile.created_at >= start_date)
+        if end_date:
+            query = query.filter(profile.created_at <= end_date)
+        gpu_hours, token_count, cost_amount, count = query.one()
+        return float(gpu_hours), int(token_count), float(cost_amount), count
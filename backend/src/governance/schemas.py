@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GovernancePolicyRequest(BaseModel):
@@ -28,8 +28,7 @@ class GovernancePolicyResponse(BaseModel):
     lastReviewedAt: Optional[datetime] = None
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EnvelopeGovernancePolicy(BaseModel):
@@ -60,8 +59,7 @@ class AuditLogResponse(BaseModel):
     metadata: Optional[dict] = None
     occurredAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EnvelopeAuditLogs(BaseModel):
@@ -70,6 +68,9 @@ class EnvelopeAuditLogs(BaseModel):
     status: str = Field(..., pattern="^(success|fail)$")
     message: str = ""
     data: Optional[list[AuditLogResponse]] = None
+    nextCursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page; null on the last page"
+    )
 
 
 class CostProfileResponse(BaseModel):
@@ -86,8 +87,7 @@ class CostProfileResponse(BaseModel):
     budgetVariance: Optional[float] = None
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EnvelopeCostProfile(BaseModel):
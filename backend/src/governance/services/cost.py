@@ -55,7 +55,6 @@ class CostService:
             token_count=token_count,
             cost_amount=cost_amount,
             cost_currency=cost_currency,
-            created_at=datetime.utcnow(),
         )
         return self.cost_repo.create(profile)
 
@@ -85,31 +84,17 @@ class CostService:
         Returns:
             Aggregated cost summary
         """
-        profiles = self.cost_repo.list(resource_type=resource_type)
-
-        total_gpu_hours = 0.0
-        total_tokens = 0
-        total_cost = 0.0
-
-        for profile in profiles:
-            # Filter by date if provided
-            if start_date and profile.created_at < start_date:
-                continue
-            if end_date and profile.created_at > end_date:
-                continue
-
-            if profile.gpu_hours:
-                total_gpu_hours += profile.gpu_hours
-            if profile.token_count:
-                total_tokens += profile.token_count
-            if profile.cost_amount:
-                total_cost += profile.cost_amount
+        total_gpu_hours, total_tokens, total_cost, resource_count = self.cost_repo.aggregate(
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
         return {
             "total_gpu_hours": total_gpu_hours,
             "total_tokens": total_tokens,
             "total_cost": total_cost,
             "currency": "USD",
-            "resource_count": len(profiles),
+            "resource_count": resource_count,
         }
 
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import AbstractSet, Callable, Optional
 from uuid import uuid4
 
 from sqlalchemy.orm import Session
@@ -27,6 +28,78 @@ class PolicyEvaluationResult:
         self.policy_id = policy_id
 
 
+# Compiled form of one policy: (action, resource_type, user_roles, metadata) -> result
+PolicyCheck = Callable[[str, str, Optional[AbstractSet[str]], Optional[dict]], PolicyEvaluationResult]
+
+
+def _compile_condition(condition: dict) -> Optional[Callable[[dict], bool]]:
+    """Build a predicate for a custom condition; None when the condition always passes."""
+    condition_type = condition.get("type")
+    if condition_type == "cost_limit":
+        limit = condition.get("limit", float("inf"))
+        return lambda metadata: metadata.get("cost", 0) <= limit
+    if condition_type == "resource_limit":
+        limit = condition.get("limit", float("inf"))
+        return lambda metadata: metadata.get("resource_count", 0) < limit
+    # "time_window" is not enforced yet; unknown condition types pass
+    return None
+
+
+def _compile_policy(policy: catalog_models.GovernancePolicy) -> PolicyCheck:
+    """Pre-extract a policy's rules into sets/predicates once, returning a fast checker."""
+    rules = policy.rules
+    policy_id = str(policy.id)
+    policy_name = policy.name
+    allowed_actions = frozenset(rules["allowed_actions"]) if "allowed_actions" in rules else None
+    required_roles = frozenset(rules["required_roles"]) if "required_roles" in rules else None
+    roles_reason = f"Insufficient roles. Required: {rules['required_roles']}" if required_roles is not None else ""
+    allowed_resource_types = (
+        frozenset(rules["allowed_resource_types"]) if "allowed_resource_types" in rules else None
+    )
+    conditions = [
+        (f"Condition failed: {condition}", predicate)
+        for condition in rules.get("conditions", ())
+        if (predicate := _compile_condition(condition)) is not None
+    ]
+    passed = PolicyEvaluationResult(allowed=True, reason="Policy passed", policy_id=policy_id)
+
+    # Single-value membership tests first, then the role set test, then conditions
+    def check(
+        action: str,
+        resource_type: str,
+        user_roles: Optional[AbstractSet[str]],
+        metadata: Optional[dict],
+    ) -> PolicyEvaluationResult:
+        if allowed_actions is not None and action not in allowed_actions:
+            return PolicyEvaluationResult(
+                allowed=False,
+                reason=f"Action '{action}' not allowed by policy '{policy_name}'",
+                policy_id=policy_id,
+            )
+        if allowed_resource_types is not None and resource_type not in allowed_resource_types:
+            return PolicyEvaluationResult(
+                allowed=False,
+                reason=f"Resource type '{resource_type}' not allowed",
+                policy_id=policy_id,
+            )
+        if required_roles is not None and (not user_roles or required_roles.isdisjoint(user_roles)):
+            return PolicyEvaluationResult(allowed=False, reason=roles_reason, policy_id=policy_id)
+        if metadata:
+            for reason, predicate in conditions:
+                if not predicate(metadata):
+                    return PolicyEvaluationResult(allowed=False, reason=reason, policy_id=policy_id)
+        return passed
+
+    return check
+
+
+# Active policies per scope, shared by all service instances in this process.
+# Writes through GovernancePolicyService invalidate their scope; the TTL bounds how
+# long another worker's writes can go unseen.
+_ACTIVE_POLICY_TTL_SECONDS = 30.0
+_active_policy_cache: dict[str, tuple[float, list[PolicyCheck]]] = {}
+
+
 class GovernancePolicyService:
     """Service for managing governance policies and evaluation."""
 
@@ -60,9 +133,10 @@ class GovernancePolicyService:
             scope=scope,
             rules=rules,
             status=status,
-            created_at=datetime.utcnow(),
         )
-        return self.policy_repo.create(policy)
+        policy = self.policy_repo.create(policy)
+        _active_policy_cache.pop(scope, None)
+        return policy
 
     def get_policy(self, policy_id: str) -> Optional[catalog_models.GovernancePolicy]:
         """Retrieve a governance policy by ID."""
@@ -95,9 +169,11 @@ class GovernancePolicyService:
         if status:
             policy.status = status
             if status == "active":
-                policy.last_reviewed_at = datetime.utcnow()
+                policy.last_reviewed_at = datetime.now(timezone.utc)
 
-        return self.policy_repo.update(policy)
+        policy = self.policy_repo.update(policy)
+        _active_policy_cache.pop(policy.scope, None)
+        return policy
 
     def delete_policy(self, policy_id: str) -> bool:
         """Delete a governance policy."""
@@ -106,6 +182,7 @@ class GovernancePolicyService:
             return False
 
         self.policy_repo.delete(policy)
+        _active_policy_cache.pop(policy.scope, None)
         return True
 
     def evaluate_policy(
@@ -131,17 +208,16 @@ class GovernancePolicyService:
         Returns:
             PolicyEvaluationResult indicating if action is allowed
         """
-        # Get active policies for the scope
-        policies = self.policy_repo.list(scope=scope, status="active")
-        if not policies:
+        # Get compiled active policies for the scope
+        checks = self._get_active_policy_checks(scope)
+        if not checks:
             # No active policies, allow by default
             return PolicyEvaluationResult(allowed=True, reason="No active policies")
 
-        # Evaluate each policy
-        for policy in policies:
-            result = self._evaluate_single_policy(
-                policy, action, resource_type, resource_id, user_roles, metadata
-            )
+        # Evaluate each policy (roles hashed once for all of them)
+        roles = frozenset(user_roles) if user_roles else None
+        for check in checks:
+            result = check(action, resource_type, roles, metadata)
             if not result.allowed:
                 # Log policy violation
                 self.audit_repo.create(
@@ -152,84 +228,19 @@ class GovernancePolicyService:
                         resource_type=resource_type,
                         resource_id=resource_id,
                         result="denied",
-                        metadata={"policy_id": str(policy.id), "reason": result.reason},
-                        occurred_at=datetime.utcnow(),
+                        metadata={"policy_id": result.policy_id, "reason": result.reason},
                     )
                 )
                 return result
 
         return PolicyEvaluationResult(allowed=True, reason="All policies passed")
 
-    def _evaluate_single_policy(
-        self,
-        policy: catalog_models.GovernancePolicy,
-        action: str,
-        resource_type: str,
-        resource_id: Optional[str],
-        user_roles: Optional[list[str]],
-        metadata: Optional[dict],
-    ) -> PolicyEvaluationResult:
-        """Evaluate a single policy's rules."""
-        rules = policy.rules
-
-        # Check action restrictions
-        if "allowed_actions" in rules:
-            if action not in rules["allowed_actions"]:
-                return PolicyEvaluationResult(
-                    allowed=False,
-                    reason=f"Action '{action}' not allowed by policy '{policy.name}'",
-                    policy_id=str(policy.id),
-                )
-
-        # Check role-based restrictions
-        if "required_roles" in rules:
-            if not user_roles or not any(role in rules["required_roles"] for role in user_roles):
-                return PolicyEvaluationResult(
-                    allowed=False,
-                    reason=f"Insufficient roles. Required: {rules['required_roles']}",
-                    policy_id=str(policy.id),
-                )
-
-        # Check resource type restrictions
-        if "allowed_resource_types" in rules:
-            if resource_type not in rules["allowed_resource_types"]:
-                return PolicyEvaluationResult(
-                    allowed=False,
-                    reason=f"Resource type '{resource_type}' not allowed",
-                    policy_id=str(policy.id),
-                )
-
-        # Check custom conditions (e.g., cost limits, time windows)
-        if "conditions" in rules:
-            for condition in rules["conditions"]:
-                if not self._evaluate_condition(condition, metadata):
-                    return PolicyEvaluationResult(
-                        allowed=False,
-                        reason=f"Condition failed: {condition}",
-                        policy_id=str(policy.id),
-                    )
-
-        return PolicyEvaluationResult(allowed=True, reason="Policy passed", policy_id=str(policy.id))
-
-    @staticmethod
-    def _evaluate_condition(condition: dict, metadata: Optional[dict]) -> bool:
-        """Evaluate a custom condition."""
-        if not metadata:
-            return True
-
-        condition_type = condition.get("type")
-        if condition_type == "cost_limit":
-            cost = metadata.get("cost", 0)
-            limit = condition.get("limit", float("inf"))
-            return cost <= limit
-        elif condition_type == "time_window":
-            # Check if action is within allowed time window
-            # This is a simplified check; real implementation would parse time windows
-            return True
-        elif condition_type == "resource_limit":
-            resource_count = metadata.get("resource_count", 0)
-            limit = condition.get("limit", float("inf"))
-            return resource_count < limit
-
-        return True
-
+    def _get_active_policy_checks(self, scope: str) -> list[PolicyCheck]:
+        """Return compiled active policies for a scope, served from the in-process TTL cache."""
+        now = time.monotonic()
+        cached = _active_policy_cache.get(scope)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        checks = [_compile_policy(policy) for policy in self.policy_repo.list(scope=scope, status="active")]
+        _active_policy_cache[scope] = (now + _ACTIVE_POLICY_TTL_SECONDS, checks)
+        return checks
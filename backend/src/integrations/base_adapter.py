@@ -6,8 +6,9 @@ consistent behavior and enable tool swapping.
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class BaseAdapter(ABC):
@@ -16,7 +17,10 @@ class BaseAdapter(ABC):
     Provides common functionality and ensures consistent interface
     across all tool integrations.
     """
-    
+
+    # Seconds a health_check() result is reused by cached_health_check().
+    health_check_ttl_seconds: float = 10.0
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize adapter with configuration.
         
@@ -25,6 +29,7 @@ class BaseAdapter(ABC):
         """
         self.config = config
         self.enabled = config.get("enabled", False)
+        self._last_health_check: Optional[Tuple[float, Dict[str, Any]]] = None
     
     @abstractmethod
     def is_available(self) -> bool:
@@ -48,6 +53,26 @@ class BaseAdapter(ABC):
             }
         """
         pass
+
+    def cached_health_check(self) -> Dict[str, Any]:
+        """Return the last health check result if it is still fresh.
+
+        Status endpoints and metrics exporters poll every adapter, often
+        several times per request; this keeps the downstream tool at one
+        probe per ``health_check_ttl_seconds``. Only healthy results are
+        cached, so a recovering tool is picked up on the next poll.
+
+        Returns:
+            Same structure as :meth:`health_check`
+        """
+        now = time.monotonic()
+        last = self._last_health_check
+        if last is not None and now - last[0] < self.health_check_ttl_seconds:
+            return last[1]
+        health = self.health_check()
+        if health.get("status") == "healthy":
+            self._last_health_check = (now, health)
+        return health
     
     def get_config(self) -> Dict[str, Any]:
         """Get adapter configuration.
@@ -5,12 +5,19 @@ Provides consistent error handling and wrapping for tool-specific errors.
 
 from __future__ import annotations
 
+import inspect
 import logging
+import re
 from typing import Any, Dict, Optional, Type
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
+# Multi-keyword message patterns used to classify wrapped errors (one scan each, lower-cased input)
+_GATED_REPO_RE = re.compile(r"gated repo|cannot access gated")
+_UNAVAILABLE_RE = re.compile(r"connection|timeout|unreachable")
+_CONFIG_RE = re.compile(r"config|missing")
+
 
 class IntegrationError(Exception):
     """Base exception for integration errors."""
@@ -70,33 +77,59 @@ class ToolOperationError(IntegrationError):
 def handle_tool_errors(
     tool_name: str,
     default_message: str = "Tool operation failed",
+    swallow: bool = False,
 ):
     """Decorator to wrap tool operations with error handling.
     
     Args:
         tool_name: Name of the tool for error messages
         default_message: Default error message if no specific message can be determined
+        swallow: Log a warning and return None instead of raising, for
+            best-effort operations that degrade gracefully
     
     Returns:
-        Decorated function with error handling
+        Decorated function with error handling; coroutine functions get an
+        async wrapper so the error is raised from the awaited call
     """
     def decorator(func):
+        def handle(e: Exception) -> None:
+            # Tracebacks are only formatted when debugging; raised errors keep
+            # their chain for whoever finally logs them
+            if swallow:
+                logger.warning(
+                    f"{default_message} ({tool_name}): {e}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
+                return None
+            if isinstance(e, IntegrationError):
+                # Re-raise integration errors as-is
+                raise e
+            logger.debug(
+                f"Error in {tool_name} operation: {func.__name__}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            raise ToolOperationError(
+                message=f"{default_message}: {str(e)}",
+                tool_name=tool_name,
+                original_error=e,
+                details={"operation": func.__name__}
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    return handle(e)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except IntegrationError:
-                # Re-raise integration errors as-is
-                raise
             except Exception as e:
-                # Wrap other exceptions
-                logger.exception(f"Error in {tool_name} operation: {func.__name__}")
-                raise ToolOperationError(
-                    message=f"{default_message}: {str(e)}",
-                    tool_name=tool_name,
-                    original_error=e,
-                    details={"operation": func.__name__}
-                )
+                return handle(e)
         return wrapper
     return decorator
 
@@ -145,7 +178,7 @@ def wrap_tool_error(
         )
     
     # Handle gated repository access errors
-    if "gated repo" in error_str or "cannot access gated" in error_str or "gated repository" in error_str:
+    if _GATED_REPO_RE.search(error_str):
         return ToolConfigurationError(
             message=(
                 "Cannot access gated repository. This model requires special access permissions. "
@@ -161,14 +194,16 @@ def wrap_tool_error(
         )
     
     # Check for common error patterns
-    if "connection" in error_str or "timeout" in error_str or "unreachable" in error_str:
+    if _UNAVAILABLE_RE.search(error_str):
         return ToolUnavailableError(
             message=f"{tool_name} service is unavailable",
             tool_name=tool_name,
             original_error=error,
             details=details
         )
-    elif "config" in error_str or ("invalid" in error_str and "revision" not in error_str and "version" not in error_str) or "missing" in error_str:
+    elif _CONFIG_RE.search(error_str) or (
+        "invalid" in error_str and "revision" not in error_str and "version" not in error_str
+    ):
         return ToolConfigurationError(
             message=f"{tool_name} configuration error",
             tool_name=tool_name,
@@ -5,6 +5,7 @@ Defines the interface for experiment tracking system adapters (MLflow, W&B, etc.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -14,7 +15,12 @@ from integrations.base_adapter import BaseAdapter
 
 
 class ExperimentTrackingAdapter(BaseAdapter):
-    """Interface for experiment tracking system adapters."""
+    """Interface for experiment tracking system adapters.
+
+    The ``a``-prefixed coroutines are the async counterparts of the sync
+    methods. By default they run the sync method in a worker thread;
+    adapters with an async client override them to await it directly.
+    """
     
     @abstractmethod
     def create_run(
@@ -145,3 +151,51 @@ class ExperimentTrackingAdapter(BaseAdapter):
         """
         pass
 
+    async def acreate_run(
+        self,
+        experiment_name: str,
+        run_name: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`create_run`."""
+        return await asyncio.to_thread(self.create_run, experiment_name, run_name, parameters, tags)
+
+    async def alog_metrics(
+        self,
+        run_id: str,
+        metrics: Dict[str, float],
+        step: Optional[int] = None,
+    ) -> None:
+        """Async variant of :meth:`log_metrics`."""
+        await asyncio.to_thread(self.log_metrics, run_id, metrics, step)
+
+    async def alog_parameters(self, run_id: str, parameters: Dict[str, Any]) -> None:
+        """Async variant of :meth:`log_parameters`."""
+        await asyncio.to_thread(self.log_parameters, run_id, parameters)
+
+    async def alog_artifacts(self, run_id: str, artifact_path: str, artifact_uri: str) -> None:
+        """Async variant of :meth:`log_artifacts`."""
+        await asyncio.to_thread(self.log_artifacts, run_id, artifact_path, artifact_uri)
+
+    async def aupdate_run_status(
+        self,
+        run_id: str,
+        status: str,
+        end_time: Optional[datetime] = None,
+    ) -> None:
+        """Async variant of :meth:`update_run_status`."""
+        await asyncio.to_thread(self.update_run_status, run_id, status, end_time)
+
+    async def aget_run(self, run_id: str) -> Dict[str, Any]:
+        """Async variant of :meth:`get_run`."""
+        return await asyncio.to_thread(self.get_run, run_id)
+
+    async def asearch_runs(
+        self,
+        experiment_name: Optional[str] = None,
+        filter_string: Optional[str] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`search_runs`."""
+        return await asyncio.to_thread(self.search_runs, experiment_name, filter_string, max_results)
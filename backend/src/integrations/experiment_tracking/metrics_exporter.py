@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Dict
 
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,11 @@ MLFLOW_RUNS_TOTAL = Gauge(
     "(best‑effort, exported when adapter can query the tracking server).",
 )
 
+MLFLOW_METRICS_DROPPED = Counter(
+    "llm_ops_mlflow_metrics_dropped_total",
+    "Metrics dropped by the MLflow adapter because its send buffer was full.",
+)
+
 
 def export_mlflow_metrics(stats: Dict[str, int]) -> None:
     """Export high‑level MLflow statistics as Prometheus metrics.
@@ -41,6 +46,6 @@ def export_mlflow_metrics(stats: Dict[str, int]) -> None:
             MLFLOW_RUNS_TOTAL.set(int(stats["runs"]))
     except Exception as exc:
         # Never break the request path because of metrics
-        logger.exception("Failed to export MLflow metrics: %s", exc)
+        logger.warning("Failed to export MLflow metrics: %s", exc)
 
 
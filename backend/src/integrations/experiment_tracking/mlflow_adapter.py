@@ -5,11 +5,16 @@ Implements the ExperimentTrackingAdapter interface using MLflow.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
 from datetime import datetime
 
 from integrations.experiment_tracking.interface import ExperimentTrackingAdapter
+from integrations.experiment_tracking.metrics_exporter import MLFLOW_METRICS_DROPPED
 from integrations.experiment_tracking.mlflow_client import MLflowClient
 from integrations.error_handler import (
     handle_tool_errors,
@@ -20,6 +25,158 @@ from integrations.error_handler import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Shared event loop that runs all MLflow client coroutines. Adapters are
+# created per request, so the loop (and the thread driving it) is owned by
+# the module rather than by each instance.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="mlflow-adapter-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def _run(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Safe to call from sync code and from threads that already run an
+    event loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _on_loop(coro: Awaitable[T]) -> T:
+    """Await a coroutine that runs on the background loop.
+
+    Lets async callers on any other event loop use the loop-bound client
+    and batcher without blocking their own loop.
+    """
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_loop()))
+
+
+# MLflow's per-request limit for log-batch metrics
+_METRIC_BATCH_SIZE = 1000
+# Longest a buffered metric waits before being sent
+_METRIC_FLUSH_INTERVAL_SECONDS = 1.0
+# Metrics buffered across all runs before new ones are dropped
+_MAX_PENDING_METRICS = 10_000
+
+
+class _MetricBatcher:
+    """Buffers metrics per run and ships them with MLflow's log-batch API.
+
+    Only touched from the background loop. A run is flushed when it reaches
+    ``_METRIC_BATCH_SIZE`` entries, after ``_METRIC_FLUSH_INTERVAL_SECONDS``,
+    before its status changes and at interpreter exit. Sends are serialized
+    so a status update never overtakes metrics already being sent.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, tuple[MLflowClient, List[Dict[str, Any]]]] = {}
+        self._pending_count = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._send_lock: Optional[asyncio.Lock] = None
+
+    async def add(
+        self,
+        client: MLflowClient,
+        run_id: str,
+        metrics: Dict[str, float],
+        step: Optional[int],
+    ) -> None:
+        if self._pending_count + len(metrics) > _MAX_PENDING_METRICS:
+            # The tracking server is not keeping up; shed load instead of growing
+            MLFLOW_METRICS_DROPPED.inc(len(metrics))
+            return
+        timestamp = int(time.time() * 1000)
+        entries = self._pending.setdefault(run_id, (client, []))[1]
+        entries.extend(
+            {"key": key, "value": float(value), "timestamp": timestamp, "step": int(step or 0)}
+            for key, value in metrics.items()
+        )
+        self._pending_count += len(metrics)
+        if len(entries) >= _METRIC_BATCH_SIZE:
+            await self.flush(run_id)
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                _METRIC_FLUSH_INTERVAL_SECONDS, lambda: asyncio.ensure_future(self.flush())
+            )
+
+    async def flush(self, run_id: Optional[str] = None) -> None:
+        """Send buffered metrics for one run, or for every run."""
+        if run_id is None:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            run_ids = list(self._pending)
+        else:
+            run_ids = [run_id] if run_id in self._pending else []
+
+        batches = []
+        for rid in run_ids:
+            client, entries = self._pending.pop(rid)
+            self._pending_count -= len(entries)
+            batches.append((client, rid, entries))
+
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        async with self._send_lock:
+            for client, rid, entries in batches:
+                for start in range(0, len(entries), _METRIC_BATCH_SIZE):
+                    try:
+                        await client.log_batch(rid, metrics=entries[start:start + _METRIC_BATCH_SIZE])
+                    except Exception as e:
+                        logger.warning(f"Failed to log metrics to MLflow: {e}")
+
+
+_metric_batcher = _MetricBatcher()
+
+
+# tracking URI -> client. Adapters are created per request; sharing the
+# client keeps its connection pool (and keep-alive connections) alive.
+_clients: Dict[str, MLflowClient] = {}
+
+
+@atexit.register
+def _shutdown() -> None:
+    """Send buffered metrics, then close the shared HTTP clients."""
+    if _loop is None:
+        return
+    _run(_metric_batcher.flush())
+    while _clients:
+        _run(_clients.popitem()[1].close())
+
+
+# tracking URI -> (time.monotonic() of the probe, healthy result). Lets
+# availability checks from per-request adapters share one probe; an entry is
+# dropped when a call finds the server unavailable.
+_health_results: Dict[str, tuple[float, Dict[str, Any]]] = {}
+_HEALTH_TTL_SECONDS = 2.0
+
+
+# (tracking URI, experiment name) -> experiment ID. Shared by all adapter
+# instances; an entry is dropped when creating a run in it fails.
+_experiment_ids: Dict[tuple[str, str], str] = {}
+
+
+# Platform run status -> MLflow run status
+_MLFLOW_STATUS_MAP = {
+    "running": "RUNNING",
+    "completed": "FINISHED",
+    "failed": "FAILED",
+    "killed": "KILLED",
+}
+
 
 class MLflowAdapter(ExperimentTrackingAdapter):
     """MLflow adapter for experiment tracking."""
@@ -40,50 +197,68 @@ class MLflowAdapter(ExperimentTrackingAdapter):
         self._client: Optional[MLflowClient] = None
     
     def _get_client(self) -> MLflowClient:
-        """Get or create MLflow client."""
+        """Get the MLflow client shared by adapters for this tracking URI."""
         if self._client is None:
-            self._client = MLflowClient(self.tracking_uri)
+            client = _clients.get(self.tracking_uri)
+            if client is None:
+                client = _clients.setdefault(self.tracking_uri, MLflowClient(self.tracking_uri))
+            self._client = client
         return self._client
     
+    def close(self) -> None:
+        """Release this adapter's reference to the shared HTTP client.
+
+        The client stays open for other adapters on the same tracking URI;
+        shared clients are closed by the module's exit hook.
+        """
+        self._client = None
+    
     def is_available(self) -> bool:
         """Check if MLflow service is available."""
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If event loop is running, we can't use async here
-                # Return True optimistically
-                return True
-            else:
-                health = loop.run_until_complete(self._get_client().health_check())
-                return health["status"] == "healthy"
-        except Exception as e:
-            logger.warning(f"MLflow availability check failed: {e}")
-            return False
+        return self.health_check()["status"] == "healthy"
     
     def health_check(self) -> Dict[str, Any]:
-        """Perform health check on MLflow service."""
+        """Perform health check on MLflow service.
+        
+        Healthy results are shared per tracking URI for
+        ``_HEALTH_TTL_SECONDS``; failures are never cached, so a recovered
+        server is seen on the next check.
+        """
+        now = time.monotonic()
+        cached = _health_results.get(self.tracking_uri)
+        if cached is not None and now - cached[0] < _HEALTH_TTL_SECONDS:
+            return cached[1]
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If event loop is running, return optimistic status
-                return {
-                    "status": "healthy",
-                    "message": "MLflow adapter initialized",
-                    "details": {},
-                }
-            else:
-                return loop.run_until_complete(self._get_client().health_check())
+            health = _run(self._get_client().health_check())
         except Exception as e:
-            return {
+            logger.warning(f"MLflow availability check failed: {e}")
+            health = {
                 "status": "unavailable",
                 "message": f"MLflow health check failed: {str(e)}",
                 "details": {"error": str(e)},
             }
+        if health.get("status") == "healthy":
+            _health_results[self.tracking_uri] = (now, health)
+        return health
+    
+    async def _resolve_experiment_id(self, experiment_name: str, create: bool = False) -> Optional[str]:
+        """Return the ID of a named experiment, creating it if asked."""
+        key = (self.tracking_uri, experiment_name)
+        experiment_id = _experiment_ids.get(key)
+        if experiment_id is None:
+            client = self._get_client()
+            experiment = await client.get_experiment_by_name(experiment_name)
+            if experiment is not None:
+                experiment_id = str(experiment["experiment_id"])
+            elif create:
+                experiment_id = await client.create_experiment(experiment_name)
+            else:
+                return None
+            _experiment_ids[key] = experiment_id
+        return experiment_id
     
     @handle_tool_errors("MLflow", "Failed to create experiment run")
-    def create_run(
+    async def _create_run(
         self,
         experiment_name: str,
         run_name: Optional[str] = None,
@@ -92,65 +267,53 @@ class MLflowAdapter(ExperimentTrackingAdapter):
     ) -> Dict[str, Any]:
         """Create a new experiment run."""
         if not self.is_enabled():
+            _health_results.pop(self.tracking_uri, None)
             raise ToolUnavailableError(
                 message="MLflow integration is disabled",
                 tool_name="mlflow",
             )
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # For async context, we need to handle differently
-                # This is a limitation - in production, use async adapter methods
-                raise RuntimeError("MLflow adapter requires async context")
-            
-            # Create run
-            result = loop.run_until_complete(
-                self._get_client().create_run(
-                    experiment_id=experiment_name,
-                    run_name=run_name,
-                    tags=tags or {},
-                )
+            experiment_id = await self._resolve_experiment_id(experiment_name, create=True)
+            result = await self._get_client().create_run(
+                experiment_id=experiment_id,
+                run_name=run_name,
+                tags=tags or {},
             )
             
             # Log parameters if provided
             if parameters:
-                loop.run_until_complete(
-                    self._get_client().log_params(result["run_id"], parameters)
-                )
+                await self._get_client().log_params(result["run_id"], parameters)
             
             return result
         except Exception as e:
-            raise wrap_tool_error(e, "mlflow", "create_run")
+            # The experiment may have been deleted; resolve it again next time
+            _experiment_ids.pop((self.tracking_uri, experiment_name), None)
+            error = wrap_tool_error(e, "mlflow", "create_run")
+            if isinstance(error, ToolUnavailableError):
+                # Don't let a cached "healthy" probe outlive a failed call
+                _health_results.pop(self.tracking_uri, None)
+            raise error
     
-    @handle_tool_errors("MLflow", "Failed to log metrics")
-    def log_metrics(
+    @handle_tool_errors("MLflow", "Failed to log metrics", swallow=True)
+    async def _log_metrics(
         self,
         run_id: str,
         metrics: Dict[str, float],
         step: Optional[int] = None,
     ) -> None:
-        """Log metrics for a run."""
+        """Queue metrics for a run; they are sent in batches via log-batch."""
         if not self.is_enabled():
             return  # Graceful degradation - silently skip if disabled
         
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                logger.warning("MLflow log_metrics called from async context - skipping")
-                return
-            
-            loop.run_until_complete(
-                self._get_client().log_metrics(run_id, metrics, step)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to log metrics to MLflow: {e}")
-            # Graceful degradation - don't raise, just log warning
+        await _metric_batcher.add(self._get_client(), run_id, metrics, step)
+    
+    async def _flush_metrics(self, run_id: Optional[str] = None) -> None:
+        """Send buffered metrics now, for one run or all runs."""
+        await _metric_batcher.flush(run_id)
     
-    @handle_tool_errors("MLflow", "Failed to log parameters")
-    def log_parameters(
+    @handle_tool_errors("MLflow", "Failed to log parameters", swallow=True)
+    async def _log_parameters(
         self,
         run_id: str,
         parameters: Dict[str, Any],
@@ -159,22 +322,10 @@ class MLflowAdapter(ExperimentTrackingAdapter):
         if not self.is_enabled():
             return  # Graceful degradation
         
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                logger.warning("MLflow log_parameters called from async context - skipping")
-                return
-            
-            loop.run_until_complete(
-                self._get_client().log_params(run_id, parameters)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to log parameters to MLflow: {e}")
-            # Graceful degradation
+        await self._get_client().log_params(run_id, parameters)
     
-    @handle_tool_errors("MLflow", "Failed to log artifacts")
-    def log_artifacts(
+    @handle_tool_errors("MLflow", "Failed to log artifacts", swallow=True)
+    async def _log_artifacts(
         self,
         run_id: str,
         artifact_path: str,
@@ -184,22 +335,10 @@ class MLflowAdapter(ExperimentTrackingAdapter):
         if not self.is_enabled():
             return  # Graceful degradation
         
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                logger.warning("MLflow log_artifacts called from async context - skipping")
-                return
-            
-            loop.run_until_complete(
-                self._get_client().log_artifact_uri(run_id, artifact_path, artifact_uri)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to log artifacts to MLflow: {e}")
-            # Graceful degradation
+        await self._get_client().log_artifact_uri(run_id, artifact_path, artifact_uri)
     
-    @handle_tool_errors("MLflow", "Failed to update run status")
-    def update_run_status(
+    @handle_tool_errors("MLflow", "Failed to update run status", swallow=True)
+    async def _update_run_status(
         self,
         run_id: str,
         status: str,
@@ -209,50 +348,33 @@ class MLflowAdapter(ExperimentTrackingAdapter):
         if not self.is_enabled():
             return  # Graceful degradation
         
-        # Map platform status to MLflow status
-        mlflow_status_map = {
-            "running": "RUNNING",
-            "completed": "FINISHED",
-            "failed": "FAILED",
-            "killed": "KILLED",
-        }
-        mlflow_status = mlflow_status_map.get(status.lower(), "RUNNING")
+        mlflow_status = _MLFLOW_STATUS_MAP.get(status.lower(), "RUNNING")
+        # Buffered metrics must land before the run is closed
+        await _metric_batcher.flush(run_id)
         
-        try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                logger.warning("MLflow update_run_status called from async context - skipping")
-                return
-            
-            loop.run_until_complete(
-                self._get_client().update_run_status(run_id, mlflow_status, end_time)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to update run status in MLflow: {e}")
-            # Graceful degradation
+        await self._get_client().update_run_status(run_id, mlflow_status, end_time)
     
     @handle_tool_errors("MLflow", "Failed to get run")
-    def get_run(self, run_id: str) -> Dict[str, Any]:
+    async def _get_run(self, run_id: str) -> Dict[str, Any]:
         """Get run information."""
         if not self.is_enabled():
+            _health_results.pop(self.tracking_uri, None)
             raise ToolUnavailableError(
                 message="MLflow integration is disabled",
                 tool_name="mlflow",
             )
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                raise RuntimeError("MLflow adapter requires async context")
-            
-            return loop.run_until_complete(self._get_client().get_run(run_id))
+            return await self._get_client().get_run(run_id)
         except Exception as e:
-            raise wrap_tool_error(e, "mlflow", "get_run")
+            error = wrap_tool_error(e, "mlflow", "get_run")
+            if isinstance(error, ToolUnavailableError):
+                # Don't let a cached "healthy" probe outlive a failed call
+                _health_results.pop(self.tracking_uri, None)
+            raise error
     
     @handle_tool_errors("MLflow", "Failed to search runs")
-    def search_runs(
+    async def _search_runs(
         self,
         experiment_name: Optional[str] = None,
         filter_string: Optional[str] = None,
@@ -263,25 +385,134 @@ class MLflowAdapter(ExperimentTrackingAdapter):
             return []  # Graceful degradation - return empty list
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                raise RuntimeError("MLflow adapter requires async context")
-            
-            # Convert experiment name to ID if needed
             experiment_ids = None
             if experiment_name:
-                # This is simplified - in production, resolve experiment name to ID
-                experiment_ids = [experiment_name]
+                experiment_id = await self._resolve_experiment_id(experiment_name)
+                if experiment_id is None:
+                    return []
+                experiment_ids = [experiment_id]
             
-            return loop.run_until_complete(
-                self._get_client().search_runs(
-                    experiment_ids=experiment_ids,
-                    filter_string=filter_string,
-                    max_results=max_results,
-                )
+            return await self._get_client().search_runs(
+                experiment_ids=experiment_ids,
+                filter_string=filter_string,
+                max_results=max_results,
             )
         except Exception as e:
             logger.warning(f"Failed to search runs in MLflow: {e}")
             return []  # Graceful degradation
 
+    # Public API. The coroutines above use the shared client and metric
+    # batcher, which belong to the background loop, so both the sync and
+    # the async methods run them there.
+
+    async def acreate_run(
+        self,
+        experiment_name: str,
+        run_name: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Create a new experiment run."""
+        return await _on_loop(self._create_run(experiment_name, run_name, parameters, tags))
+    
+    async def alog_metrics(
+        self,
+        run_id: str,
+        metrics: Dict[str, float],
+        step: Optional[int] = None,
+    ) -> None:
+        """Queue metrics for a run; they are sent in batches via log-batch."""
+        await _on_loop(self._log_metrics(run_id, metrics, step))
+    
+    async def aflush_metrics(self, run_id: Optional[str] = None) -> None:
+        """Send buffered metrics now, for one run or all runs."""
+        await _on_loop(self._flush_metrics(run_id))
+    
+    async def alog_parameters(self, run_id: str, parameters: Dict[str, Any]) -> None:
+        """Log parameters for a run."""
+        await _on_loop(self._log_parameters(run_id, parameters))
+    
+    async def alog_artifacts(self, run_id: str, artifact_path: str, artifact_uri: str) -> None:
+        """Log artifact URI for a run."""
+        await _on_loop(self._log_artifacts(run_id, artifact_path, artifact_uri))
+    
+    async def aupdate_run_status(
+        self,
+        run_id: str,
+        status: str,
+        end_time: Optional[datetime] = None,
+    ) -> None:
+        """Update run status."""
+        await _on_loop(self._update_run_status(run_id, status, end_time))
+    
+    async def aget_run(self, run_id: str) -> Dict[str, Any]:
+        """Get run information."""
+        return await _on_loop(self._get_run(run_id))
+    
+    async def asearch_runs(
+        self,
+        experiment_name: Optional[str] = None,
+        filter_string: Optional[str] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Search for experiment runs."""
+        return await _on_loop(self._search_runs(experiment_name, filter_string, max_results))
+    
+
+    def create_run(
+        self,
+        experiment_name: str,
+        run_name: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Create a new experiment run."""
+        return _run(self._create_run(experiment_name, run_name, parameters, tags))
+    
+    def log_metrics(
+        self,
+        run_id: str,
+        metrics: Dict[str, float],
+        step: Optional[int] = None,
+    ) -> None:
+        """Queue metrics for a run without waiting for the background loop.
+
+        Metrics are best-effort: they are sent by the batcher and dropped if
+        the tracking server falls too far behind. Use :meth:`flush_metrics`
+        when they must be delivered before continuing.
+        """
+        asyncio.run_coroutine_threadsafe(self._log_metrics(run_id, metrics, step), _get_loop())
+    
+    def flush_metrics(self, run_id: Optional[str] = None) -> None:
+        """Send buffered metrics now, for one run or all runs."""
+        _run(self._flush_metrics(run_id))
+    
+    def log_parameters(self, run_id: str, parameters: Dict[str, Any]) -> None:
+        """Log parameters for a run."""
+        _run(self._log_parameters(run_id, parameters))
+    
+    def log_artifacts(self, run_id: str, artifact_path: str, artifact_uri: str) -> None:
+        """Log artifact URI for a run."""
+        _run(self._log_artifacts(run_id, artifact_path, artifact_uri))
+    
+    def update_run_status(
+        self,
+        run_id: str,
+        status: str,
+        end_time: Optional[datetime] = None,
+    ) -> None:
+        """Update run status."""
+        _run(self._update_run_status(run_id, status, end_time))
+    
+    def get_run(self, run_id: str) -> Dict[str, Any]:
+        """Get run information."""
+        return _run(self._get_run(run_id))
+    
+    def search_runs(
+        self,
+        experiment_name: Optional[str] = None,
+        filter_string: Optional[str] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Search for experiment runs."""
+        return _run(self._search_runs(experiment_name, filter_string, max_results))
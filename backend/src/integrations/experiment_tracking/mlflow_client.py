@@ -7,12 +7,17 @@ and managing experiments.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Per-request limits of MLflow's log-batch endpoint
+_MAX_BATCH_METRICS = 1000
+_MAX_BATCH_PARAMS = 100
+
 
 class MLflowClient:
     """Client for interacting with MLflow Tracking Server via REST API."""
@@ -37,7 +42,7 @@ class MLflowClient:
         """Create a new MLflow run.
         
         Args:
-            experiment_id: Experiment ID (can be experiment name or ID)
+            experiment_id: Experiment ID
             run_name: Optional run name
             tags: Optional tags dictionary
         
@@ -49,11 +54,8 @@ class MLflowClient:
                 "status": str
             }
         """
-        # First, get or create experiment
-        experiment = await self._get_or_create_experiment(experiment_id)
-        experiment_id_str = str(experiment["experiment_id"])
+        experiment_id_str = str(experiment_id)
         
-        # Create run
         url = f"{self.tracking_uri}/api/2.0/mlflow/runs/create"
         payload = {
             "experiment_id": experiment_id_str,
@@ -90,23 +92,44 @@ class MLflowClient:
             metrics: Dictionary of metric names to values
             step: Optional step number
         """
-        url = f"{self.tracking_uri}/api/2.0/mlflow/runs/log-metric"
+        timestamp = int(time.time() * 1000)
+        entries = [
+            {"key": name, "value": float(value), "timestamp": timestamp, "step": int(step or 0)}
+            for name, value in metrics.items()
+        ]
+        for start in range(0, len(entries), _MAX_BATCH_METRICS):
+            await self.log_batch(run_id, metrics=entries[start:start + _MAX_BATCH_METRICS])
+    
+    async def log_batch(
+        self,
+        run_id: str,
+        metrics: Optional[List[Dict[str, Any]]] = None,
+        params: Optional[List[Dict[str, str]]] = None,
+        tags: Optional[List[Dict[str, str]]] = None,
+    ) -> None:
+        """Log metrics, parameters and tags for a run in one request.
         
-        for metric_name, metric_value in metrics.items():
-            payload = {
-                "run_id": run_id,
-                "key": metric_name,
-                "value": float(metric_value),
-            }
-            if step is not None:
-                payload["step"] = int(step)
-            
-            try:
-                response = await self._client.post(url, json=payload)
-                response.raise_for_status()
-            except httpx.HTTPError as e:
-                logger.error(f"Failed to log metric {metric_name}: {e}")
-                raise
+        Args:
+            run_id: Run ID
+            metrics: Metric entries ({"key", "value", "timestamp", "step"});
+                MLflow accepts at most 1000 per request
+            params: Parameter entries ({"key", "value"})
+            tags: Tag entries ({"key", "value"})
+        """
+        url = f"{self.tracking_uri}/api/2.0/mlflow/runs/log-batch"
+        payload = {
+            "run_id": run_id,
+            "metrics": metrics or [],
+            "params": params or [],
+            "tags": tags or [],
+        }
+        
+        try:
+            response = await self._client.post(url, json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to log batch for run {run_id}: {e}")
+            raise
     
     async def log_params(
         self,
@@ -119,21 +142,10 @@ class MLflowClient:
             run_id: Run ID
             params: Dictionary of parameter names to values
         """
-        url = f"{self.tracking_uri}/api/2.0/mlflow/runs/log-parameter"
-        
-        for param_name, param_value in params.items():
-            payload = {
-                "run_id": run_id,
-                "key": param_name,
-                "value": str(param_value),  # MLflow requires string values
-            }
-            
-            try:
-                response = await self._client.post(url, json=payload)
-                response.raise_for_status()
-            except httpx.HTTPError as e:
-                logger.error(f"Failed to log parameter {param_name}: {e}")
-                raise
+        # MLflow requires string values
+        entries = [{"key": name, "value": str(value)} for name, value in params.items()]
+        for start in range(0, len(entries), _MAX_BATCH_PARAMS):
+            await self.log_batch(run_id, params=entries[start:start + _MAX_BATCH_PARAMS])
     
     async def log_artifact_uri(
         self,
@@ -160,19 +172,16 @@ class MLflowClient:
             key: Tag key
             value: Tag value
         """
-        url = f"{self.tracking_uri}/api/2.0/mlflow/runs/set-tag"
-        payload = {
-            "run_id": run_id,
-            "key": key,
-            "value": value,
-        }
+        await self.set_tags(run_id, {key: value})
+    
+    async def set_tags(self, run_id: str, tags: Dict[str, str]) -> None:
+        """Set several tags on a run in one request.
         
-        try:
-            response = await self._client.post(url, json=payload)
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to set tag {key}: {e}")
-            raise
+        Args:
+            run_id: Run ID
+            tags: Dictionary of tag keys to values
+        """
+        await self.log_batch(run_id, tags=[{"key": key, "value": value} for key, value in tags.items()])
     
     async def update_run_status(
         self,
@@ -284,16 +293,15 @@ class MLflowClient:
             logger.error(f"Failed to search runs: {e}")
             raise
     
-    async def _get_or_create_experiment(self, experiment_name: str) -> Dict[str, Any]:
-        """Get or create an experiment.
+    async def get_experiment_by_name(self, experiment_name: str) -> Optional[Dict[str, Any]]:
+        """Look up an experiment by name.
         
         Args:
             experiment_name: Experiment name
         
         Returns:
-            Dictionary with experiment information
+            Dictionary with experiment information, or None if it does not exist
         """
-        # Try to get experiment by name
         url = f"{self.tracking_uri}/api/2.0/mlflow/experiments/get-by-name"
         params = {"experiment_name": experiment_name}
         
@@ -303,15 +311,24 @@ class MLflowClient:
                 return response.json()["experiment"]
         except httpx.HTTPError:
             pass
+        return None
+    
+    async def create_experiment(self, experiment_name: str) -> str:
+        """Create an experiment.
         
-        # Create experiment if it doesn't exist
+        Args:
+            experiment_name: Experiment name
+        
+        Returns:
+            ID of the new experiment
+        """
         url = f"{self.tracking_uri}/api/2.0/mlflow/experiments/create"
         payload = {"name": experiment_name}
         
         try:
             response = await self._client.post(url, json=payload)
             response.raise_for_status()
-            return response.json()["experiment"]
+            return str(response.json()["experiment_id"])
         except httpx.HTTPError as e:
             logger.error(f"Failed to create experiment: {e}")
             raise
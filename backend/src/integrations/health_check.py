@@ -60,7 +60,7 @@ class IntegrationHealthCheck:
                     }
                     continue
                 
-                health = adapter.health_check()
+                health = adapter.cached_health_check()
                 status = health.get("status", "unavailable")
                 
                 results[name] = {
@@ -126,7 +126,7 @@ class IntegrationHealthCheck:
             }
         
         try:
-            health = adapter.health_check()
+            health = adapter.cached_health_check()
             return {
                 "status": health.get("status", "unavailable"),
                 "enabled": True,
@@ -55,7 +55,7 @@ def export_integration_health_metrics(adapters: Dict[str, BaseAdapter]) -> None:
 
     for name, adapter in adapters.items():
         try:
-            health = adapter.health_check()
+            health = adapter.cached_health_check()
             status = health.get("status", "unavailable")
 
             # Try to infer concrete tool name from settings + adapter type
@@ -24,7 +24,7 @@ from integrations.error_handler import (
     ToolOperationError,
 )
 from core.clients.object_store import get_object_store_client
-from core.settings import get_settings
+from core.settings import get_object_store_bucket, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -562,7 +562,7 @@ class HuggingFaceAdapter(RegistryAdapter):
         start_time = time.time()
         
         s3_client = get_object_store_client()
-        bucket_name = self.settings.object_store_bucket or self.settings.training_namespace
+        bucket_name = get_object_store_bucket()
         
         storage_path = f"models/{model_id}/{version}/"
         storage_uri = f"s3://{bucket_name}/{storage_path}"
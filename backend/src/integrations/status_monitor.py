@@ -29,7 +29,7 @@ def refresh_integration_status(adapters: Dict[str, BaseAdapter]) -> Dict[str, st
 
     for name, adapter in adapters.items():
         try:
-            health = adapter.health_check()
+            health = adapter.cached_health_check()
             snapshot[name] = health.get("status", "unavailable")
         except Exception as exc:
             logger.exception("Failed to refresh health for %s: %s", name, exc)
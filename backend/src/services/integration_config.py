@@ -81,7 +81,7 @@ class IntegrationConfigService:
             config["enabled"] = self.settings.experiment_tracking_enabled
             if tool_name == "mlflow":
                 config["config"] = {
-                    "tracking_uri": str(self.settings.mlflow_tracking_uri) if self.settings.mlflow_tracking_uri else None,
+                    "tracking_uri": self.settings.mlflow_tracking_uri,
                     "backend_store_uri": self.settings.mlflow_backend_store_uri,
                     "artifact_root": self.settings.mlflow_default_artifact_root,
                 }
@@ -141,7 +141,7 @@ class IntegrationConfigService:
             "stg": self.settings.training_gpu_types_stg,
             "prod": self.settings.training_gpu_types_prod,
         }
-        values = env_map.get(env, [])
+        values = env_map.get(env, ())
         gpu_types: list[Dict[str, Any]] = []
         for idx, gpu_id in enumerate(values):
             if not gpu_id:
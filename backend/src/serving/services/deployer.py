@@ -23,6 +23,31 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _serving_resources(
+    use_gpu: bool,
+    memory_request: Optional[str] = None,
+    cpu_request: Optional[str] = None,
+    memory_limit: Optional[str] = None,
+    cpu_limit: Optional[str] = None,
+) -> tuple[dict, dict]:
+    """
+    Return mutable (requests, limits) copies of the prebuilt serving resources.
+    Explicit values override the settings defaults (GPU or CPU-only).
+    """
+    base = settings.serving_gpu_resources if use_gpu else settings.serving_cpu_only_resources
+    requests = dict(base["requests"])
+    limits = dict(base["limits"])
+    if memory_request:
+        requests["memory"] = memory_request
+    if cpu_request:
+        requests["cpu"] = cpu_request
+    if memory_limit:
+        limits["memory"] = memory_limit
+    if cpu_limit:
+        limits["cpu"] = cpu_limit
+    return requests, limits
+
+
 def _build_s3_sync_resources(
     model_uri: str,
     target_root: str = "/models",
@@ -758,27 +783,9 @@ class ServingDeployer:
         
         # Build resource requirements
         # Priority: explicit parameters > settings defaults based on GPU setting
-        if use_gpu:
-            resource_requests = {
-                "memory": memory_request or settings.serving_memory_request,
-                "cpu": cpu_request or settings.serving_cpu_request,
-                "nvidia.com/gpu": "1"
-            }
-            resource_limits = {
-                "memory": memory_limit or settings.serving_memory_limit,
-                "cpu": cpu_limit or settings.serving_cpu_limit,
-                "nvidia.com/gpu": "1"
-            }
-        else:
-            # CPU-only deployment with reduced resources
-            resource_requests = {
-                "memory": memory_request or settings.serving_cpu_only_memory_request,
-                "cpu": cpu_request or settings.serving_cpu_only_cpu_request,
-            }
-            resource_limits = {
-                "memory": memory_limit or settings.serving_cpu_only_memory_limit,
-                "cpu": cpu_limit or settings.serving_cpu_only_cpu_limit,
-            }
+        resource_requests, resource_limits = _serving_resources(
+            use_gpu, memory_request, cpu_request, memory_limit, cpu_limit
+        )
         
         # Determine if this is a vLLM image (check image name)
         is_vllm = "vllm" in serving_runtime_image.lower()
@@ -793,13 +800,8 @@ class ServingDeployer:
             default_memory_limit = settings.serving_cpu_only_memory_limit
             # Parse memory limit to check if it's too low
             try:
-                # Convert to bytes for comparison (rough estimate)
-                if default_memory_limit.endswith("Gi"):
-                    limit_gb = float(default_memory_limit[:-2])
-                elif default_memory_limit.endswith("Mi"):
-                    limit_gb = float(default_memory_limit[:-2]) / 1024
-                else:
-                    limit_gb = 1.0  # Default assumption
+                # Byte value is parsed once on the settings object
+                limit_gb = settings.serving_cpu_only_memory_limit_bytes / 1024**3
                 
                 # If limit is less than 4Gi, increase to 4Gi for TGI model download
                 if limit_gb < 4.0:
@@ -1365,29 +1367,9 @@ class ServingDeployer:
             
             # Fallback to adapter-based deployment (legacy)
             # Build resource requests/limits
-            resource_requests = {}
-            resource_limits = {}
-            
-            if use_gpu:
-                resource_requests = {
-                    "memory": memory_request or settings.serving_memory_request,
-                    "cpu": cpu_request or settings.serving_cpu_request,
-                    "nvidia.com/gpu": "1",
-                }
-                resource_limits = {
-                    "memory": memory_limit or settings.serving_memory_limit,
-                    "cpu": cpu_limit or settings.serving_cpu_limit,
-                    "nvidia.com/gpu": "1",
-                }
-            else:
-                resource_requests = {
-                    "memory": memory_request or settings.serving_cpu_only_memory_request,
-                    "cpu": cpu_request or settings.serving_cpu_only_cpu_request,
-                }
-                resource_limits = {
-                    "memory": memory_limit or settings.serving_cpu_only_memory_limit,
-                    "cpu": cpu_limit or settings.serving_cpu_only_cpu_limit,
-                }
+            resource_requests, resource_limits = _serving_resources(
+                use_gpu, memory_request, cpu_request, memory_limit, cpu_limit
+            )
             
             # Extract model name from metadata or use endpoint name
             model_name = endpoint_name
@@ -1468,27 +1450,7 @@ class ServingDeployer:
 
         try:
             # Build resource requirements based on GPU setting and settings
-            if use_gpu:
-                resource_requests = {
-                    "memory": settings.serving_memory_request,
-                    "cpu": settings.serving_cpu_request,
-                    "nvidia.com/gpu": "1",
-                }
-                resource_limits = {
-                    "memory": settings.serving_memory_limit,
-                    "cpu": settings.serving_cpu_limit,
-                    "nvidia.com/gpu": "1",
-                }
-            else:
-                # CPU-only deployment with reduced resources
-                resource_requests = {
-                    "memory": settings.serving_cpu_only_memory_request,
-                    "cpu": settings.serving_cpu_only_cpu_request,
-                }
-                resource_limits = {
-                    "memory": settings.serving_cpu_only_memory_limit,
-                    "cpu": settings.serving_cpu_only_cpu_limit,
-                }
+            resource_requests, resource_limits = _serving_resources(use_gpu)
 
             # Detect vLLM runtime from image name
             is_vllm = "vllm" in serving_runtime_image.lower()
@@ -1503,13 +1465,8 @@ class ServingDeployer:
                 default_memory_limit = settings.serving_cpu_only_memory_limit
                 # Parse memory limit to check if it's too low
                 try:
-                    # Convert to bytes for comparison (rough estimate)
-                    if default_memory_limit.endswith("Gi"):
-                        limit_gb = float(default_memory_limit[:-2])
-                    elif default_memory_limit.endswith("Mi"):
-                        limit_gb = float(default_memory_limit[:-2]) / 1024
-                    else:
-                        limit_gb = 1.0  # Default assumption
+                    # Byte value is parsed once on the settings object
+                    limit_gb = settings.serving_cpu_only_memory_limit_bytes / 1024**3
                     
                     # If limit is less than 4Gi, increase to 4Gi for TGI model download
                     if limit_gb < 4.0:
@@ -57,13 +57,11 @@ class KubernetesScheduler:
         resources = client.V1ResourceRequirements(
             requests={
                 "nvidia.com/gpu": str(gpu_count),
-                "memory": settings.training_gpu_memory_request,
-                "cpu": settings.training_gpu_cpu_request,
+                **settings.training_gpu_resources["requests"],
             },
             limits={
                 "nvidia.com/gpu": str(gpu_count),
-                "memory": settings.training_gpu_memory_limit,
-                "cpu": settings.training_gpu_cpu_limit,
+                **settings.training_gpu_resources["limits"],
             },
         )
 
@@ -76,11 +74,8 @@ class KubernetesScheduler:
         )
 
         # Build node selector and tolerations for GPU nodes
-        node_selector = settings.training_gpu_node_selector.copy() if settings.training_gpu_node_selector else {}
-        tolerations = []
-        if settings.training_gpu_tolerations:
-            for tol in settings.training_gpu_tolerations:
-                tolerations.append(client.V1Toleration(**tol))
+        node_selector = dict(settings.training_gpu_node_selector)
+        tolerations = [client.V1Toleration(**tol) for tol in settings.training_gpu_tolerations]
 
         pod_template = client.V1PodTemplateSpec(
             metadata=client.V1ObjectMeta(labels={"app": job_name, "job-id": job_id}),
@@ -209,13 +204,11 @@ class KubernetesScheduler:
         resources = client.V1ResourceRequirements(
             requests={
                 "nvidia.com/gpu": str(gpu_count),
-                "memory": settings.training_gpu_distributed_memory_request,
-                "cpu": settings.training_gpu_cpu_request,
+                **settings.training_gpu_distributed_resources["requests"],
             },
             limits={
                 "nvidia.com/gpu": str(gpu_count),
-                "memory": settings.training_gpu_distributed_memory_limit,
-                "cpu": settings.training_gpu_cpu_limit,
+                **settings.training_gpu_distributed_resources["limits"],
             },
         )
 
@@ -228,11 +221,8 @@ class KubernetesScheduler:
         )
 
         # Build node selector and tolerations for GPU nodes
-        node_selector = settings.training_gpu_node_selector.copy() if settings.training_gpu_node_selector else {}
-        tolerations = []
-        if settings.training_gpu_tolerations:
-            for tol in settings.training_gpu_tolerations:
-                tolerations.append(client.V1Toleration(**tol))
+        node_selector = dict(settings.training_gpu_node_selector)
+        tolerations = [client.V1Toleration(**tol) for tol in settings.training_gpu_tolerations]
 
         pod_template = client.V1PodTemplateSpec(
             metadata=client.V1ObjectMeta(
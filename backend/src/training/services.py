@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from catalog import models as catalog_models
 from catalog.services.catalog import CatalogService
 from core.image_config import get_image_config
-from core.settings import get_settings
+from core.settings import get_object_store_bucket, get_settings
 from services.experiment_tracking_service import ExperimentTrackingService
 from services.integration_config import IntegrationConfigService
 from training.converters.mlflow_converter import MLflowConverter
@@ -356,7 +356,7 @@ class TrainingJobService:
                 # CPU-only training
                 # For CPU-only training, always use settings defaults to ensure compatibility with local dev environments
                 # Ignore resource_profile values to prevent requesting too much memory (e.g., 8Gi on minikube)
-                cpu_cores = int(settings.training_cpu_only_cpu_request)
+                cpu_cores = max(1, settings.training_cpu_only_cpu_request_millicores // 1000)
                 memory = settings.training_cpu_only_memory_request
                 
                 logger.info(
@@ -763,7 +763,7 @@ class TrainingJobService:
         import re
         sanitized_name = re.sub(r'[^a-z0-9-]', '', sanitized_name)
         
-        bucket_name = settings.object_store_bucket or settings.training_namespace
+        bucket_name = get_object_store_bucket()
         # Folder structure: models/{sanitized_name}/{version}/
         # This is for model catalog entries created by training jobs
         storage_path = f"models/{sanitized_name}/{model_version}/"
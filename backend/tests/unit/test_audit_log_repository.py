@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from catalog import models as catalog_models
+from governance.repositories import AuditLogRepository
+
+
+def test_list_pages_by_occurred_at_and_id_cursor():
+    engine = create_engine("sqlite://")
+    catalog_models.AuditLog.__table__.create(engine)
+    base = datetime(2025, 11, 27, 12, 0, 0)
+
+    with Session(engine) as session:
+        repo = AuditLogRepository(session)
+        # Two entries share a timestamp so the id tie-breaker is exercised
+        for offset in (0, 1, 1, 2, 3):
+            repo.create(
+                catalog_models.AuditLog(
+                    id=uuid4(),
+                    actor_id="alice",
+                    action="create",
+                    resource_type="model",
+                    result="allowed",
+                    occurred_at=base + timedelta(minutes=offset),
+                )
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            page = repo.list(limit=2, cursor=cursor)
+            seen.extend(page)
+            if len(page) < 2:
+                break
+            cursor = (page[-1].occurred_at, page[-1].id)
+
+    assert len({log.id for log in seen}) == 5
+    keys = [(log.occurred_at, log.id) for log in seen]
+    assert keys == sorted(keys, reverse=True)
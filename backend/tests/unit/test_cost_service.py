@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from catalog import models as catalog_models
+from governance.services.cost import CostService
+
+
+@pytest.fixture
+def service():
+    engine = create_engine("sqlite://")
+    catalog_models.CostProfile.__table__.create(engine)
+    with Session(engine) as session:
+        yield CostService(session)
+
+
+def test_aggregate_costs_sums_in_sql_and_treats_nulls_as_zero(service):
+    service.create_cost_profile("training", uuid4(), "2025-11", gpu_hours=1.5, token_count=10, cost_amount=2.25)
+    service.create_cost_profile("serving", uuid4(), "2025-11", token_count=5)
+
+    assert service.aggregate_costs() == {
+        "total_gpu_hours": 1.5,
+        "total_tokens": 15,
+        "total_cost": 2.25,
+        "currency": "USD",
+        "resource_count": 2,
+    }
+    assert service.aggregate_costs(resource_type="serving")["resource_count"] == 1
+
+
+def test_aggregate_costs_counts_only_profiles_in_date_range(service):
+    service.create_cost_profile("training", uuid4(), "2025-11", gpu_hours=2.0)
+
+    summary = service.aggregate_costs(start_date=datetime(2100, 1, 1))
+
+    assert summary["total_gpu_hours"] == 0.0
+    assert summary["resource_count"] == 0
+
+
+def test_list_cost_profiles_filters_newest_first(service):
+    older = service.create_cost_profile("training", uuid4(), "2025-10")
+    older.created_at = datetime(2025, 10, 1)
+    newer = service.create_cost_profile("training", uuid4(), "2025-11")
+    service.create_cost_profile("serving", uuid4(), "2025-11")
+
+    profiles = service.list_cost_profiles(resource_type="training")
+
+    assert [p.id for p in profiles] == [newer.id, older.id]
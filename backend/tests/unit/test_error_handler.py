@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from integrations.error_handler import (
+    ToolConfigurationError,
+    ToolOperationError,
+    ToolUnavailableError,
+    handle_tool_errors,
+    wrap_tool_error,
+)
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Connection refused", ToolUnavailableError),
+        ("Read timeout", ToolUnavailableError),
+        ("Cannot access gated repo for url", ToolConfigurationError),
+        ("bad config value", ToolConfigurationError),
+        ("Missing key", ToolConfigurationError),
+        ("invalid token", ToolConfigurationError),
+        ("invalid revision main2", ToolOperationError),
+        ("Revision Not Found", ToolOperationError),
+        ("boom", ToolOperationError),
+    ],
+)
+def test_wrap_tool_error_classifies_by_message(message, expected):
+    wrapped = wrap_tool_error(RuntimeError(message), "huggingface", "download")
+
+    assert type(wrapped) is expected
+    assert wrapped.details == {"operation": "download"}
+
+
+def test_handle_tool_errors_wraps_coroutine_failures():
+    @handle_tool_errors("MLflow", "Failed to log metrics")
+    async def log_metrics():
+        raise RuntimeError("boom")
+
+    with pytest.raises(ToolOperationError, match="Failed to log metrics: boom"):
+        asyncio.run(log_metrics())
+
+
+def test_handle_tool_errors_swallow_returns_none():
+    @handle_tool_errors("MLflow", "Failed to log parameters", swallow=True)
+    def log_parameters():
+        raise ToolUnavailableError(message="down", tool_name="mlflow")
+
+    assert log_parameters() is None
@@ -1,12 +1,85 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
 from integrations.base_adapter import BaseAdapter
+from integrations.error_handler import ToolUnavailableError
+from integrations.experiment_tracking import mlflow_adapter as mlflow_adapter_module
 from integrations.experiment_tracking.mlflow_adapter import MLflowAdapter
+from integrations.experiment_tracking.mlflow_client import MLflowClient
 from integrations.orchestration.argo_adapter import ArgoWorkflowsAdapter
 from integrations.serving.kserve_adapter import KServeAdapter
 from integrations.versioning.dvc_adapter import DVCAdapter
 
 
+def _mlflow_response(path, body):
+    if path == "/api/2.0/mlflow/experiments/get-by-name":
+        if body["experiment_name"] == "llm":
+            return 200, {"experiment": {"experiment_id": "7"}}
+        return 404, {"error_code": "RESOURCE_DOES_NOT_EXIST"}
+    if path in ("/api/2.0/mlflow/runs/create", "/api/2.0/mlflow/runs/get"):
+        info = {"run_id": "r1", "experiment_id": "7", "status": "RUNNING", "start_time": 0}
+        return 200, {"run": {"info": info, "data": {}}}
+    if path == "/api/2.0/mlflow/runs/search":
+        return 200, {"runs": []}
+    return 200, {}
+
+
+class _MLflowHandler(BaseHTTPRequestHandler):
+    """Minimal MLflow REST stand-in that records every request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def _respond(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else dict(parse_qsl(url.query))
+        self.server.requests.append((url.path, body))
+        status, payload = _mlflow_response(url.path, body)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mlflow_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MLflowHandler)
+    server.requests = []
+    server.uri = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mlflow_adapter(mlflow_server):
+    adapter = MLflowAdapter({"enabled": True, "tracking_uri": mlflow_server.uri})
+    yield adapter
+    adapter.flush_metrics()
+    client = mlflow_adapter_module._clients.pop(mlflow_server.uri, None)
+    if client is not None:
+        mlflow_adapter_module._run(client.close())
+
+
 def test_base_adapter_config_and_enabled_flag():
     adapter = type(
         "DummyAdapter",
@@ -21,6 +94,38 @@ def test_base_adapter_config_and_enabled_flag():
     assert adapter.get_config()["enabled"] is True
 
 
+def test_cached_health_check_reuses_result_within_ttl(monkeypatch):
+    results = iter(
+        [
+            {"status": "unavailable", "message": "down", "details": {}},
+            {"status": "healthy", "message": "", "details": {}},
+            {"status": "healthy", "message": "", "details": {}},
+        ]
+    )
+    calls = []
+    adapter = type(
+        "DummyAdapter",
+        (BaseAdapter,),
+        {
+            "is_available": lambda self: True,
+            "health_check": lambda self: calls.append(1) or next(results),
+        },
+    )({"enabled": True})
+    clock = iter([100.0, 101.0, 105.0, 111.0])
+    monkeypatch.setattr("integrations.base_adapter.time.monotonic", lambda: next(clock))
+
+    # Failures are not cached, so recovery shows up on the next poll
+    assert adapter.cached_health_check()["status"] == "unavailable"
+    assert adapter.cached_health_check()["status"] == "healthy"
+    assert len(calls) == 2
+
+    adapter.cached_health_check()
+    assert len(calls) == 2
+
+    adapter.cached_health_check()
+    assert len(calls) == 3
+
+
 def test_dvc_adapter_init_uses_provided_cache_dir(tmp_path):
     cache_dir = tmp_path / "dvc-cache"
     adapter = DVCAdapter(
@@ -42,3 +147,114 @@ def test_adapter_classes_are_baseadapter_subclasses():
     assert issubclass(DVCAdapter, BaseAdapter)
 
 
+def test_mlflow_adapter_runs_client_calls_from_async_context():
+    adapter = MLflowAdapter({"enabled": True, "tracking_uri": "http://127.0.0.1:9"})
+
+    async def probe():
+        return adapter.health_check()
+
+    # Previously short-circuited to an optimistic "healthy" inside a running loop
+    assert asyncio.run(probe())["status"] == "unavailable"
+
+
+def test_mlflow_adapter_sync_and_async_calls_share_the_client(mlflow_adapter):
+    assert mlflow_adapter.get_run("r1")["run_id"] == "r1"
+    assert asyncio.run(mlflow_adapter.aget_run("r1"))["run_id"] == "r1"
+    assert mlflow_adapter.get_run("r1")["run_id"] == "r1"
+
+
+def test_mlflow_adapter_batches_metrics_until_status_update(mlflow_adapter, mlflow_server):
+    mlflow_adapter.log_metrics("run-1", {"loss": 0.5}, step=1)
+    mlflow_adapter.log_metrics("run-1", {"loss": 0.25, "acc": 0.9}, step=2)
+    mlflow_adapter.update_run_status("run-1", "completed")
+
+    (batch_path, batch), (update_path, update) = mlflow_server.requests
+    assert batch_path == "/api/2.0/mlflow/runs/log-batch"
+    assert [(m["key"], m["value"], m["step"]) for m in batch["metrics"]] == [
+        ("loss", 0.5, 1),
+        ("loss", 0.25, 2),
+        ("acc", 0.9, 2),
+    ]
+    assert update_path == "/api/2.0/mlflow/runs/update"
+    assert update["status"] == "FINISHED"
+
+
+def test_mlflow_adapter_resolves_experiment_names_once(mlflow_adapter, mlflow_server):
+    assert mlflow_adapter.create_run("llm")["experiment_id"] == "7"
+    mlflow_adapter.search_runs(experiment_name="llm")
+    assert mlflow_adapter.search_runs(experiment_name="missing") == []
+
+    paths = [path for path, _ in mlflow_server.requests]
+    assert paths.count("/api/2.0/mlflow/experiments/get-by-name") == 2
+    searches = [body for path, body in mlflow_server.requests if path == "/api/2.0/mlflow/runs/search"]
+    assert [body["experiment_ids"] for body in searches] == [["7"]]
+
+
+def test_mlflow_adapters_share_a_client_per_tracking_uri(mlflow_adapter, mlflow_server):
+    other = MLflowAdapter({"enabled": True, "tracking_uri": mlflow_server.uri})
+
+    assert mlflow_adapter._get_client() is other._get_client()
+
+    # Closing one adapter must not close the client the other still holds
+    other.close()
+    assert mlflow_adapter.get_run("r1")["run_id"] == "r1"
+
+
+def test_mlflow_adapter_drops_metrics_when_buffer_is_full(mlflow_adapter, mlflow_server, monkeypatch):
+    monkeypatch.setattr(mlflow_adapter_module, "_MAX_PENDING_METRICS", 2)
+    dropped_before = mlflow_adapter_module.MLFLOW_METRICS_DROPPED._value.get()
+
+    mlflow_adapter.log_metrics("run-2", {"a": 1.0, "b": 2.0})
+    mlflow_adapter.log_metrics("run-2", {"c": 3.0})
+    mlflow_adapter.flush_metrics("run-2")
+
+    (_, batch), = mlflow_server.requests
+    assert [m["key"] for m in batch["metrics"]] == ["a", "b"]
+    assert mlflow_adapter_module.MLFLOW_METRICS_DROPPED._value.get() == dropped_before + 1
+
+
+def test_mlflow_health_is_shared_per_tracking_uri_within_ttl(mlflow_adapter, mlflow_server):
+    adapters = [mlflow_adapter] + [MLflowAdapter({"enabled": True, "tracking_uri": mlflow_server.uri}) for _ in range(2)]
+
+    assert all(adapter.is_available() for adapter in adapters)
+    assert adapters[0].health_check()["status"] == "healthy"
+    assert [path for path, _ in mlflow_server.requests] == ["/health"]
+
+
+def test_mlflow_unavailable_run_calls_drop_the_shared_health_result(mlflow_adapter, mlflow_server):
+    assert mlflow_adapter.is_available()
+    assert mlflow_server.uri in mlflow_adapter_module._health_results
+
+    disabled = MLflowAdapter({"enabled": False, "tracking_uri": mlflow_server.uri})
+    with pytest.raises(ToolUnavailableError):
+        disabled.create_run("llm")
+
+    assert mlflow_server.uri not in mlflow_adapter_module._health_results
+
+
+def test_mlflow_unreachable_server_is_not_cached_as_healthy():
+    uri = "http://127.0.0.1:9"
+    adapter = MLflowAdapter({"enabled": True, "tracking_uri": uri})
+    mlflow_adapter_module._health_results[uri] = (float("inf"), {"status": "healthy"})
+
+    with pytest.raises(ToolUnavailableError):
+        adapter.get_run("r1")
+    assert uri not in mlflow_adapter_module._health_results
+
+    assert not adapter.is_available()
+    assert uri not in mlflow_adapter_module._health_results
+
+def test_mlflow_client_sends_metrics_and_params_with_log_batch(mlflow_server):
+    client = MLflowClient(mlflow_server.uri)
+
+    async def log():
+        await client.log_metrics("run-3", {"loss": 0.5, "acc": 1}, step=4)
+        await client.log_params("run-3", {"lr": 0.001, "epochs": 3})
+        await client.close()
+
+    asyncio.run(log())
+
+    (metrics_path, metrics_payload), (params_path, params_payload) = mlflow_server.requests
+    assert metrics_path == params_path == "/api/2.0/mlflow/runs/log-batch"
+    assert [(m["key"], m["value"], m["step"]) for m in metrics_payload["metrics"]] == [("loss", 0.5, 4), ("acc", 1.0, 4)]
+    assert params_payload["params"] == [{"key": "lr", "value": "0.001"}, {"key": "epochs", "value": "3"}]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from core.observability import ObservabilityMiddleware
+
+
+def _request_count(route: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "llm_ops_request_total", {"method": "GET", "route": route, "status": status}
+    )
+    return value or 0.0
+
+
+def test_failing_requests_are_counted_as_server_errors():
+    app = FastAPI()
+
+    @app.get("/obs-test/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(ObservabilityMiddleware)
+    client = TestClient(app, raise_server_exceptions=False)
+    before = _request_count("/obs-test/boom", "500")
+
+    response = client.get("/obs-test/boom")
+
+    assert response.status_code == 500
+    assert _request_count("/obs-test/boom", "500") == before + 1
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from catalog import models as catalog_models
+from governance.services import policies
+from governance.services.policies import GovernancePolicyService
+
+
+@pytest.fixture
+def service():
+    engine = create_engine("sqlite://")
+    catalog_models.GovernancePolicy.__table__.create(engine)
+    catalog_models.AuditLog.__table__.create(engine)
+    policies._active_policy_cache.clear()
+    with Session(engine) as session:
+        yield GovernancePolicyService(session)
+    policies._active_policy_cache.clear()
+
+
+def test_active_policies_are_cached_and_invalidated_on_write(service, monkeypatch):
+    service.create_policy("models-only", "model", {"allowed_actions": ["read"]}, status="active")
+    assert not service.evaluate_policy("model", "delete", "model").allowed
+
+    calls = []
+    original_list = service.policy_repo.list
+    monkeypatch.setattr(service.policy_repo, "list", lambda **kw: calls.append(kw) or original_list(**kw))
+
+    assert not service.evaluate_policy("model", "delete", "model").allowed
+    assert calls == []
+
+    policy = service.list_policies(scope="model")[0]
+    service.update_policy(str(policy.id), status="retired")
+    assert service.evaluate_policy("model", "delete", "model").allowed
+
+
+def test_compiled_rules_check_roles_resource_types_and_conditions(service):
+    service.create_policy(
+        "guarded",
+        "model",
+        {
+            "required_roles": ["admin"],
+            "allowed_resource_types": ["model"],
+            "conditions": [{"type": "cost_limit", "limit": 10}, {"type": "time_window"}],
+        },
+        status="active",
+    )
+
+    assert not service.evaluate_policy("model", "create", "model", user_roles=["viewer"]).allowed
+    assert not service.evaluate_policy("model", "create", "dataset", user_roles=["admin"]).allowed
+    denied = service.evaluate_policy("model", "create", "model", user_roles=["admin"], metadata={"cost": 11})
+    assert denied.reason.startswith("Condition failed")
+    assert service.evaluate_policy("model", "create", "model", user_roles=["admin"], metadata={"cost": 5}).allowed
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from core.settings import get_settings
+from governance.middleware import PolicyEngine, RBACMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/llm-ops/v1/items")
+    def items(request: Request):
+        return {"actor": request.state.actor_id, "roles": sorted(request.state.roles)}
+
+    @app.get("/llm-ops/v1/health/live")
+    def health():
+        return {"ok": True}
+
+    @app.get("/index.html")
+    def index():
+        return {"ok": True}
+
+    app.add_middleware(RBACMiddleware, policy_engine=PolicyEngine())
+    return TestClient(app)
+
+
+def test_missing_identity_headers_are_rejected(client):
+    response = client.get("/llm-ops/v1/items", headers={"X-User-Roles": " , "})
+
+    assert response.status_code == 401
+    assert response.json() == {"status": "fail", "message": "Missing identity headers", "data": None}
+
+
+def test_roles_without_required_role_are_forbidden(client):
+    response = client.get("/llm-ops/v1/items", headers={"X-User-Id": "alice", "X-User-Roles": "viewer"})
+
+    assert response.status_code == 403
+    assert response.json()["message"] == "Access denied by policy"
+
+
+def test_required_role_is_allowed_and_exposed_on_request_state(client):
+    role = get_settings().default_required_role
+    response = client.get("/llm-ops/v1/items", headers={"X-User-Id": "alice", "X-User-Roles": f"viewer, {role}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"actor": "alice", "roles": sorted(["viewer", role])}
+
+
+@pytest.mark.parametrize("path", ["/llm-ops/v1/health/live", "/index.html"])
+def test_health_and_non_api_paths_skip_rbac(client, path):
+    assert client.get(path).status_code == 200
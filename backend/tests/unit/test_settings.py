@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from core.settings import Settings, parse_cpu_millicores, parse_memory_bytes
+
+
+def test_parse_cpu_millicores_accepts_cores_and_millicores():
+    assert parse_cpu_millicores("2") == 2000
+    assert parse_cpu_millicores("500m") == 500
+    assert parse_cpu_millicores("0.5") == 500
+
+
+def test_parse_memory_bytes_accepts_binary_and_decimal_units():
+    assert parse_memory_bytes("512Mi") == 512 * 1024**2
+    assert parse_memory_bytes("16Gi") == 16 * 1024**3
+    assert parse_memory_bytes("1G") == 1000**3
+
+
+@pytest.mark.parametrize("value", ["", "abc", "2Xi", "-1Gi"])
+def test_parse_memory_bytes_rejects_invalid_quantities(value):
+    with pytest.raises(ValueError):
+        parse_memory_bytes(value)
+
+
+def test_gpu_types_are_normalized_to_tuples(monkeypatch):
+    monkeypatch.setenv("TRAINING_GPU_TYPES_DEV", " nvidia-a100 , ,nvidia-rtx-4090,")
+    monkeypatch.setenv("TRAINING_GPU_TYPES_PROD", '["nvidia-h100 "]')
+
+    settings = Settings()
+
+    assert settings.training_gpu_types_dev == ("nvidia-a100", "nvidia-rtx-4090")
+    assert settings.training_gpu_types_stg == ()
+    assert settings.training_gpu_types_prod == ("nvidia-h100",)
+
+
+def test_resource_specs_are_read_only():
+    settings = Settings()
+
+    requests = settings.serving_gpu_resources["requests"]
+    assert requests["nvidia.com/gpu"] == "1"
+    assert requests["memory"] == settings.serving_memory_request
+    assert settings.training_gpu_distributed_resources["limits"]["memory"] == (
+        settings.training_gpu_distributed_memory_limit
+    )
+    with pytest.raises(TypeError):
+        requests["memory"] = "1Gi"